@@ -7,6 +7,10 @@ REQUIRED:
     PyGame
     Numpy
 
+OPTIONAL:
+    Numba (JIT-compiled trace projection)
+    orjson (faster config load/save)
+
 Shows TWO I-V curves on the same plot:
     - DUT1 (CH1 - Black lead):  CH1 voltage vs current
     - DUT2 (CH2 - Red lead): CH2 voltage vs current
@@ -27,12 +31,26 @@ Features:
 
 import pygame
 import serial
-import struct
+import serial.tools.list_ports
 import numpy as np
 import sys
 import time
 import json
-import os
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Default colors
 BLACK = (0, 0, 0)
@@ -47,22 +65,85 @@ GREEN = (50, 255, 150)
 YELLOW = (255, 255, 50)
 ORANGE = (255, 150, 50)
 
+# Characters accepted by text input boxes
+PRINTABLE_CHARS = frozenset(string.printable) - frozenset('\t\n\r\x0b\x0c')
+DIGIT_CHARS = frozenset(string.digits)
+
+# Channel value -> brightened hover value, built once for all buttons
+HOVER_LUT = tuple(np.minimum(np.arange(256) + 30, 255).tolist())
+
 # Fixed scale constants from original C++ code
 ADC_MAX = 2800  # Maximum ADC range
 ADC_ORIGIN = 2048  # Mid-scale ADC reference (12-bit center)
 FLOOR_RATIO = 7.0 / 8.0  # Baseline at 7/8 down the screen
 
+# Raw frame format: little-endian 16-bit words carrying 12-bit ADC samples.
+# Read as signed so all ADC math stays int16; masking to 12 bits clears the sign.
+SAMPLE_DTYPE = np.dtype('<i2')
+FRAME_SAMPLES = 1008  # Interleaved drive/ch1/ch2 samples per frame
+CHANNEL_POINTS = FRAME_SAMPLES // 3
+FRAME_BYTES = FRAME_SAMPLES * SAMPLE_DTYPE.itemsize
+READ_DEADLINE = 0.5  # Seconds allowed for a full frame to arrive
+PROBE_WORKERS = 4  # Ports probed at once during auto-detect
+# Normalized trace coordinates are clamped to this range (in plot widths/heights)
+# before the int32 cast; far enough out that clamped points stay off the clipped
+# plot, near enough that extreme zoom can't overflow the cast
+NORM_MIN = -4.0
+NORM_MAX = 5.0
+
+# Rows of a decoded (5, CHANNEL_POINTS) frame: drive, DUT voltages, DUT currents
+ROW_DRIVE, ROW_V1, ROW_V2, ROW_I1, ROW_I2 = range(5)
+
 OUTPUT_DEBUG_TEXT = False
 
 def debug_print(contents: str = None):
     if OUTPUT_DEBUG_TEXT:
         print(contents)
 
+
+if NUMBA_AVAILABLE:
+    # Frozen (PyInstaller) builds have no writable source dir for the cache
+    @njit(cache=not getattr(sys, 'frozen', False))
+    def _project_kernel(voltage, current, out, x_min, x_max, y_min, y_max,
+                        rect_right, rect_width, rect_top, rect_height):
+        """Single-pass normalize/clamp/invert/truncate of samples into out (N x 2)"""
+        x_span = x_max - x_min
+        y_span = y_max - y_min
+        for i in range(voltage.shape[0]):
+            x_norm = (voltage[i] - x_min) / x_span if x_span != 0 else 0.5
+            y_norm = (current[i] - y_min) / y_span if y_span != 0 else 0.5
+            # Kept as two independent ifs so LLVM can lower them to min/max
+            if x_norm < NORM_MIN:
+                x_norm = NORM_MIN
+            if x_norm > NORM_MAX:
+                x_norm = NORM_MAX
+            if y_norm < NORM_MIN:
+                y_norm = NORM_MIN
+            if y_norm > NORM_MAX:
+                y_norm = NORM_MAX
+            out[i, 0] = int(rect_right - x_norm * rect_width)
+            out[i, 1] = int(rect_top + y_norm * rect_height)
+        return out
+
+
+_text_cache = {}
+
+
+def render_text(font, text, color):
+    """Render antialiased text, reusing the surface for a repeated (font, text, color)"""
+    key = (font, text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = _text_cache[key] = font.render(text, True, color)
+    return surf
+
+
 class ConfigManager:
     """Manages application configuration and settings"""
 
     DEFAULT_CONFIG = {
         'serial_port': 'COM3',
+        'serial_read_chunk_size': 4096,
         'window_width': 1080,
         'window_height': 1080,
         'colors': {
@@ -94,24 +175,35 @@ class ConfigManager:
     def __init__(self, config_file='curvebug_config.json'):
         self.config_file = config_file
         self.config = self.DEFAULT_CONFIG.copy()
+        self._cache = {}  # keys tuple -> value, cleared whenever the config changes
+        self.colors_version = 0  # Bumped whenever a color actually changes
         self.load_config()
 
     def load_config(self):
         """Load configuration from file"""
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    saved_config = json.load(f)
-                    self._deep_update(self.config, saved_config)
-                debug_print(f"Configuration loaded from {self.config_file}")
-            except Exception as e:
-                debug_print(f"Error loading config: {e}, using defaults")
+        try:
+            # One read, then parse the whole buffer
+            with open(self.config_file, 'rb') as f:
+                data = f.read()
+            saved_config = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+            self._deep_update(self.config, saved_config)
+            self._cache.clear()
+            self.colors_version += 1
+            debug_print(f"Configuration loaded from {self.config_file}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            debug_print(f"Error loading config: {e}, using defaults")
 
     def save_config(self):
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.config, indent=2).encode('utf-8')
+            with open(self.config_file, 'wb') as f:
+                f.write(data)
             debug_print(f"Configuration saved to {self.config_file}")
             return True
         except Exception as e:
@@ -119,20 +211,30 @@ class ConfigManager:
             return False
 
     def _deep_update(self, base_dict, update_dict):
-        """Recursively update nested dictionary"""
-        for key, value in update_dict.items():
-            if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-                self._deep_update(base_dict[key], value)
-            else:
-                base_dict[key] = value
+        """Update nested dictionary in place, merging sub-dicts present in both"""
+        stack = [(base_dict, update_dict)]
+        while stack:
+            base, update = stack.pop()
+            for key, value in update.items():
+                base_value = base.get(key)
+                if type(base_value) is dict and type(value) is dict:
+                    stack.append((base_value, value))
+                else:
+                    base[key] = value
 
     def get(self, *keys):
         """Get nested config value"""
+        try:
+            return self._cache[keys]
+        except KeyError:
+            pass
+
         value = self.config
         for key in keys:
             value = value.get(key)
             if value is None:
-                return None
+                break
+        self._cache[keys] = value
         return value
 
     def set(self, value, *keys):
@@ -142,7 +244,10 @@ class ConfigManager:
             if key not in config:
                 config[key] = {}
             config = config[key]
+        if keys[0] == 'colors' and config.get(keys[-1]) != value:
+            self.colors_version += 1
         config[keys[-1]] = value
+        self._cache.clear()
 
 
 class Button:
@@ -152,19 +257,20 @@ class Button:
         self.rect = pygame.Rect(rect)
         self.text = text
         self.color = color
-        self.hover_color = tuple(min(c + 30, 255) for c in color)
+        r, g, b = color
+        self.hover_color = (HOVER_LUT[r], HOVER_LUT[g], HOVER_LUT[b])
         self.text_color = text_color
         self.font = font
         self.hovered = False
+        self.text_surf = font.render(text, True, text_color)
 
     def draw(self, screen):
         color = self.hover_color if self.hovered else self.color
-        pygame.draw.rect(screen, color, self.rect)
+        screen.fill(color, self.rect)
         pygame.draw.rect(screen, self.text_color, self.rect, 2)
 
-        text_surf = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+        text_rect = self.text_surf.get_rect(center=self.rect.center)
+        screen.blit(self.text_surf, text_rect)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
@@ -178,35 +284,44 @@ class Button:
 class InputBox:
     """Text input box"""
 
-    def __init__(self, rect, text, font):
+    def __init__(self, rect, text, font, allowed_chars=PRINTABLE_CHARS):
         self.rect = pygame.Rect(rect)
         self.text = text
         self.font = font
+        self.allowed_chars = allowed_chars
         self.active = False
         self.cursor_visible = True
         self.cursor_timer = 0
+        self.text_surf = font.render(text, True, WHITE)
+
+    def set_text(self, text):
+        """Change the text, re-rendering its surface"""
+        self.text = text
+        self.text_surf = self.font.render(text, True, WHITE)
 
     def draw(self, screen):
         color = WHITE if self.active else GRAY
-        pygame.draw.rect(screen, DARK_GRAY, self.rect)
+        screen.fill(DARK_GRAY, self.rect)
         pygame.draw.rect(screen, color, self.rect, 2)
 
-        text_surf = self.font.render(self.text, True, WHITE)
-        screen.blit(text_surf, (self.rect.x + 5, self.rect.y + 5))
+        screen.blit(self.text_surf, (self.rect.x + 5, self.rect.y + 5))
 
         # Cursor
         if self.active and self.cursor_visible:
-            cursor_x = self.rect.x + 5 + text_surf.get_width()
+            cursor_x = self.rect.x + 5 + self.text_surf.get_width()
             pygame.draw.line(screen, WHITE,
                              (cursor_x, self.rect.y + 5),
                              (cursor_x, self.rect.bottom - 5), 2)
 
     def update(self, dt):
+        """Advance the cursor blink, returns True if the box needs redrawing"""
         if self.active:
             self.cursor_timer += dt
             if self.cursor_timer > 0.5:
                 self.cursor_visible = not self.cursor_visible
                 self.cursor_timer = 0
+                return True
+        return False
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -219,9 +334,9 @@ class InputBox:
                 self.active = False
                 return True
             elif event.key == pygame.K_BACKSPACE:
-                self.text = self.text[:-1]
-            elif event.unicode.isprintable():
-                self.text += event.unicode
+                self.set_text(self.text[:-1])
+            elif event.unicode in self.allowed_chars:
+                self.set_text(self.text + event.unicode)
 
         return False
 
@@ -245,6 +360,11 @@ class ColorPickerDialog:
         self.slider_height = 20
         self.dragging = -1
 
+        # Color preview box, relative to the dialog
+        preview_size = 80
+        self.preview_rect = pygame.Rect(self.width - preview_size - 30, 60, preview_size, preview_size)
+        self._update_fill_widths()
+
         # Buttons
         self.ok_button = Button(
             (self.x + self.width - 220, self.y + self.height - 60, 100, 40),
@@ -255,10 +375,77 @@ class ColorPickerDialog:
             'Cancel', RED, WHITE, font
         )
 
+        self.overlay = self._create_overlay(screen_width, screen_height)
+        self.chrome = self._create_chrome()
+        self.gradients = self._create_gradients()
+        self.layout_sliders()
+
+    @staticmethod
+    def _create_overlay(width, height):
+        """Dimming layer drawn behind the dialog"""
+        overlay = pygame.Surface((width, height))
+        overlay.set_alpha(200)
+        overlay.fill(BLACK)
+        return overlay
+
+    def _create_chrome(self):
+        """Pre-draw everything static in the dialog, in dialog-relative coordinates"""
+        chrome = pygame.Surface((self.width, self.height))
+
+        # Dialog background
+        chrome.fill(DARK_GRAY)
+        pygame.draw.rect(chrome, WHITE, chrome.get_rect(), 3)
+
+        # Title
+        chrome.blit(render_text(self.font, 'Choose Color', WHITE), (20, 15))
+
+        # RGB slider labels and tracks
+        for i, label in enumerate(('Red:', 'Green:', 'Blue:')):
+            y_pos = 60 + i * 45
+            chrome.blit(render_text(self.font, label, WHITE), (30, y_pos))
+
+            slider_rect = pygame.Rect(100, y_pos, self.slider_width, self.slider_height)
+            chrome.fill(MID_GRAY, slider_rect)
+            pygame.draw.rect(chrome, GRAY, slider_rect, 1)
+
+        # Preview label
+        chrome.blit(render_text(self.font, 'Preview', LIGHT_GRAY),
+                    (self.preview_rect.x, self.preview_rect.y - 25))
+        return chrome
+
+    def _create_gradients(self):
+        """Pre-render a black-to-full gradient strip for each RGB slider"""
+        ramp = np.linspace(0, 255, self.slider_width).astype(np.uint8)
+        gradients = []
+        for channel in range(3):
+            pixels = np.zeros((self.slider_width, self.slider_height, 3), dtype=np.uint8)
+            pixels[:, :, channel] = ramp[:, np.newaxis]
+            strip = pygame.Surface((self.slider_width, self.slider_height))
+            pygame.surfarray.blit_array(strip, pixels)
+            gradients.append(strip)
+        return tuple(gradients)
+
+    def reposition(self, x, y):
+        """Move the dialog's top-left corner to (x, y)"""
+        self.x = x
+        self.y = y
+        self.ok_button.rect.topleft = (x + self.width - 220, y + self.height - 60)
+        self.cancel_button.rect.topleft = (x + self.width - 110, y + self.height - 60)
+        self.layout_sliders()
+
+    def layout_sliders(self):
+        """Compute the slider track rects for the current dialog position"""
+        self.slider_x = self.x + 100
+        self.slider_rects = [
+            pygame.Rect(self.slider_x, self.y + 60 + i * 45, self.slider_width, self.slider_height)
+            for i in range(3)
+        ]
+
     def show(self, color):
         """Show the color picker with initial color"""
         self.color = list(color)
         self.original_color = list(color)
+        self._update_fill_widths()
         self.active = True
 
     def hide(self):
@@ -269,64 +456,30 @@ class ColorPickerDialog:
         if not self.active:
             return
 
-        # Semi-transparent overlay
-        overlay = pygame.Surface((screen.get_width(), screen.get_height()))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
-
-        # Dialog background
-        dialog_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        pygame.draw.rect(screen, DARK_GRAY, dialog_rect)
-        pygame.draw.rect(screen, WHITE, dialog_rect, 3)
-
-        # Title
-        title = self.font.render('Choose Color', True, WHITE)
-        screen.blit(title, (self.x + 20, self.y + 15))
-
-        # RGB sliders
-        labels = ['Red:', 'Green:', 'Blue:']
-        slider_start_y = self.y + 60
-
-        for i, label in enumerate(labels):
-            y_pos = slider_start_y + i * 45
+        # Semi-transparent overlay, only reallocated if the screen size changed
+        if self.overlay.get_size() != screen.get_size():
+            self.overlay = self._create_overlay(*screen.get_size())
+        screen.blit(self.overlay, (0, 0))
 
-            # Label
-            text = self.font.render(label, True, WHITE)
-            screen.blit(text, (self.x + 30, y_pos))
+        # Dialog background, title, labels and slider tracks in one blit
+        screen.blit(self.chrome, (self.x, self.y))
 
-            # Slider background
-            slider_rect = pygame.Rect(
-                self.x + 100, y_pos,
-                self.slider_width, self.slider_height
-            )
-            pygame.draw.rect(screen, MID_GRAY, slider_rect)
-            pygame.draw.rect(screen, GRAY, slider_rect, 1)
+        for i, slider_rect in enumerate(self.slider_rects):
+            y_pos = slider_rect.y
 
-            # Slider fill
-            fill_width = int((self.color[i] / 255) * self.slider_width)
-            fill_rect = pygame.Rect(self.x + 100, y_pos, fill_width, self.slider_height)
-            slider_colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
-            pygame.draw.rect(screen, slider_colors[i], fill_rect)
+            # Slider fill, cropped from the channel's gradient strip
+            screen.blit(self.gradients[i], slider_rect.topleft,
+                        (0, 0, self.fill_widths[i], self.slider_height))
 
             # Value text
-            value_text = self.font.render(str(self.color[i]), True, WHITE)
+            value_text = render_text(self.font, str(self.color[i]), WHITE)
             screen.blit(value_text, (self.x + 100 + self.slider_width + 10, y_pos))
 
         # Color preview
-        preview_size = 80
-        preview_rect = pygame.Rect(
-            self.x + self.width - preview_size - 30,
-            slider_start_y,
-            preview_size, preview_size
-        )
-        pygame.draw.rect(screen, tuple(self.color), preview_rect)
+        preview_rect = self.preview_rect.move(self.x, self.y)
+        screen.fill(self.preview_color, preview_rect)
         pygame.draw.rect(screen, WHITE, preview_rect, 2)
 
-        # Preview label
-        preview_label = self.font.render('Preview', True, LIGHT_GRAY)
-        screen.blit(preview_label, (preview_rect.x, preview_rect.y - 25))
-
         # Buttons
         self.ok_button.draw(screen)
         self.cancel_button.draw(screen)
@@ -347,14 +500,8 @@ class ColorPickerDialog:
             return 'cancel'
 
         # Slider handling
-        slider_start_y = self.y + 60
-
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            for i in range(3):
-                slider_rect = pygame.Rect(
-                    self.x + 100, slider_start_y + i * 45,
-                    self.slider_width, self.slider_height
-                )
+            for i, slider_rect in enumerate(self.slider_rects):
                 if slider_rect.collidepoint(event.pos):
                     self.dragging = i
                     self._update_slider(i, event.pos[0])
@@ -373,9 +520,19 @@ class ColorPickerDialog:
         return None
 
     def _update_slider(self, index, mouse_x):
-        slider_x = self.x + 100
-        relative_x = max(0, min(mouse_x - slider_x, self.slider_width))
-        self.color[index] = int((relative_x / self.slider_width) * 255)
+        relative_x = mouse_x - self.slider_x
+        if relative_x < 0:
+            relative_x = 0
+        elif relative_x > self.slider_width:
+            relative_x = self.slider_width
+        self.color[index] = relative_x * 255 // self.slider_width
+        self.fill_widths[index] = self.color[index] * self.slider_width // 255
+        self.preview_color[index] = self.color[index]
+
+    def _update_fill_widths(self):
+        """Slider fill widths and preview color for the current color"""
+        self.fill_widths = [c * self.slider_width // 255 for c in self.color]
+        self.preview_color = pygame.Color(*self.color)
 
 
 class ColorSwatch:
@@ -384,36 +541,41 @@ class ColorSwatch:
     def __init__(self, rect, color, label, font):
         self.rect = pygame.Rect(rect)
         self.color = list(color)
+        self.fill_color = pygame.Color(*color)
         self.label = label
         self.font = font
         self.hovered = False
+        self.label_surf = font.render(label, True, WHITE)
+        self.label_pos = (self.rect.x, self.rect.y + 5)
+        self.color_rect = pygame.Rect(self.rect.right - 100, self.rect.y, 100, 35)
 
     def draw(self, screen):
         # Label
-        label_surf = self.font.render(self.label, True, WHITE)
-        screen.blit(label_surf, (self.rect.x, self.rect.y + 5))
+        screen.blit(self.label_surf, self.label_pos)
+
+        return self.draw_swatch(screen)
 
+    def draw_swatch(self, screen):
+        """Draw only the color box, for callers that pre-draw the label"""
         # Color box
-        color_rect = pygame.Rect(self.rect.right - 100, self.rect.y, 100, 35)
-        pygame.draw.rect(screen, tuple(self.color), color_rect)
+        screen.fill(self.fill_color, self.color_rect)
 
         border_color = WHITE if self.hovered else GRAY
-        pygame.draw.rect(screen, border_color, color_rect, 2)
+        pygame.draw.rect(screen, border_color, self.color_rect, 2)
 
-        return color_rect
+        return self.color_rect
 
     def handle_event(self, event):
-        color_rect = pygame.Rect(self.rect.right - 100, self.rect.y, 100, 35)
-
         if event.type == pygame.MOUSEMOTION:
-            self.hovered = color_rect.collidepoint(event.pos)
+            self.hovered = self.color_rect.collidepoint(event.pos)
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1 and color_rect.collidepoint(event.pos):
+            if event.button == 1 and self.color_rect.collidepoint(event.pos):
                 return True
         return False
 
     def update_color(self, color):
         self.color = list(color)
+        self.fill_color = pygame.Color(*color)
 
 
 class SettingsWindow:
@@ -429,6 +591,7 @@ class SettingsWindow:
         self.small_font = pygame.font.Font(None, 20)
 
         self.active = False
+        self.dirty = True  # Set when the overlay needs to be redrawn
         self.tab = 0  # 0=Display, 1=Colors, 2=Keybinds, 3=Serial
 
         self.color_picker = None
@@ -439,6 +602,8 @@ class SettingsWindow:
         self.keybinds_settings_text = 'Keyboard Shortcuts'
         self.serial_settings_text = 'Serial Port Configuration'
         self.active_settings_window = self.display_settings_text
+        self.tab_titles = (self.display_settings_text, self.color_settings_text,
+                           self.keybinds_settings_text, self.serial_settings_text)
 
         self._calculate_layout()
         self._init_widgets()
@@ -468,12 +633,8 @@ class SettingsWindow:
 
         # Update color picker position if it exists
         if self.color_picker:
-            self.color_picker.x = (width - self.color_picker.width) // 2
-            self.color_picker.y = (height - self.color_picker.height) // 2
-            self.color_picker.ok_button.rect.x = self.color_picker.x + self.color_picker.width - 220
-            self.color_picker.ok_button.rect.y = self.color_picker.y + self.color_picker.height - 60
-            self.color_picker.cancel_button.rect.x = self.color_picker.x + self.color_picker.width - 110
-            self.color_picker.cancel_button.rect.y = self.color_picker.y + self.color_picker.height - 60
+            self.color_picker.reposition((width - self.color_picker.width) // 2,
+                                         (height - self.color_picker.height) // 2)
 
     def _init_widgets(self):
         """Initialize UI widgets"""
@@ -490,94 +651,6 @@ class SettingsWindow:
             for i, text in enumerate(['Display', 'Colors', 'Keybinds', 'Serial'])
         ]
 
-        # Calculate column layout for better use of space
-        col_width = min(400, self.content_width // 2 - 40)
-        col1_x = self.content_x + 40
-        col2_x = self.content_x + self.content_width // 2 + 20
-
-        # Display settings
-        self.width_input = InputBox(
-            (col1_x + 180, self.content_y + 30, 150, 40),
-            str(self.config.get('window_width')),
-            self.font
-        )
-        self.height_input = InputBox(
-            (col1_x + 180, self.content_y + 90, 150, 40),
-            str(self.config.get('window_height')),
-            self.font
-        )
-
-        # Color swatches - use two columns for better space usage
-        self.color_swatches = {}
-        color_configs = [
-            ('background', 'Background'),
-            ('dut1_trace', 'DUT1 Trace (Blue)'),
-            ('dut2_trace', 'DUT2 Trace (Red)'),
-            ('dut1_dimmed', 'DUT1 Dimmed'),
-            ('dut2_dimmed', 'DUT2 Dimmed'),
-            ('grid_background', 'Grid Background'),
-            ('grid', 'Grid Lines'),
-            ('crosshair', 'Crosshair'),
-            ('label', 'Axis Labels'),
-            ('axis_title', 'Axis Titles'),
-            ('border', 'Border'),
-            ('dut_voltage', 'DUT Voltage'),
-        ]
-
-        # Calculate rows per column
-        items_per_col = (len(color_configs) + 1) // 2
-        swatch_width = min(500, (self.content_width - 80) // 2)
-
-        for i, (key, label) in enumerate(color_configs):
-            color = self.config.get('colors', key)
-            col = i // items_per_col
-            row = i % items_per_col
-
-            x = col1_x if col == 0 else col2_x
-            y = self.content_y + 20 + row * 50
-
-            swatch = ColorSwatch(
-                (x, y, swatch_width, 40),
-                color, label, self.font
-            )
-            self.color_swatches[key] = swatch
-
-        # Keybind inputs - two columns
-        self.keybind_inputs = {}
-        self.keybind_labels = {
-            'quit': 'Quit:',
-            'pause': 'Pause:',
-            'single_channel': 'Single Channel:',
-            'auto_scale': 'Auto Scale:',
-            'fit_window': 'Fit Window:',
-            'reset_view': 'Reset View:',
-            'cycle_mode': 'Cycle Mode:',
-            'settings': 'Settings:',
-        }
-
-        keybind_names = list(self.config.get('keybinds').keys())
-        items_per_col = (len(keybind_names) + 1) // 2
-
-        for i, name in enumerate(keybind_names):
-            col = i // items_per_col
-            row = i % items_per_col
-
-            x = col1_x if col == 0 else col2_x
-            y = self.content_y + 20 + row * 60
-
-            self.keybind_inputs[name] = InputBox(
-                (x + 200, y, 120, 40),
-                self.config.get('keybinds', name),
-                self.font
-            )
-
-        # Serial port input
-        self.serial_input = InputBox(
-            (col1_x + 180, self.content_y + 30, min(400, self.content_width - 300), 40),
-            self.config.get('serial_port'),
-            self.font
-        )
-
         # Bottom buttons - centered
         button_width = 140
         button_height = 50
@@ -601,10 +674,126 @@ class SettingsWindow:
         )
 
         self.scroll_offset = 0
+        self.active_input = None  # Input box with keyboard focus, if any
+
+        # Pre-drawn static chrome per tab, rebuilt lazily for the new layout
+        self.static_backgrounds = {}
+
+        # Tab widgets are only built once their tab is opened
+        self.width_input = None
+        self.height_input = None
+        self.color_swatches = {}
+        self.swatch_grid = {}  # (col, row) -> color key, for click lookup
+        self.hovered_swatch = None
+        self.keybind_inputs = {}
+        self.keybind_order = ()
+        self.serial_input = None
+        self.built_tabs = set()
+        self._init_tab(self.tab)
+
+    def _init_tab(self, tab):
+        """Create the widgets of one tab, unless they already exist for this layout"""
+        if tab in self.built_tabs:
+            return
+        self.built_tabs.add(tab)
+
+        # Column layout for better use of space
+        col1_x = self.content_x + 40
+        col2_x = self.content_x + self.content_width // 2 + 20
+
+        if tab == 0:  # Display
+            self.width_input = InputBox(
+                (col1_x + 180, self.content_y + 30, 150, 40),
+                str(self.config.get('window_width')),
+                self.font,
+                DIGIT_CHARS
+            )
+            self.height_input = InputBox(
+                (col1_x + 180, self.content_y + 90, 150, 40),
+                str(self.config.get('window_height')),
+                self.font,
+                DIGIT_CHARS
+            )
+
+        elif tab == 1:  # Colors
+            # Color swatches - use two columns for better space usage
+            color_configs = [
+                ('background', 'Background'),
+                ('dut1_trace', 'DUT1 Trace (Blue)'),
+                ('dut2_trace', 'DUT2 Trace (Red)'),
+                ('dut1_dimmed', 'DUT1 Dimmed'),
+                ('dut2_dimmed', 'DUT2 Dimmed'),
+                ('grid_background', 'Grid Background'),
+                ('grid', 'Grid Lines'),
+                ('crosshair', 'Crosshair'),
+                ('label', 'Axis Labels'),
+                ('axis_title', 'Axis Titles'),
+                ('border', 'Border'),
+                ('dut_voltage', 'DUT Voltage'),
+            ]
+
+            # Calculate rows per column
+            items_per_col = (len(color_configs) + 1) // 2
+            swatch_width = min(500, (self.content_width - 80) // 2)
+
+            for i, (key, label) in enumerate(color_configs):
+                color = self.config.get('colors', key)
+                col = i // items_per_col
+                row = i % items_per_col
+
+                x = col1_x if col == 0 else col2_x
+                y = self.content_y + 20 + row * 50
+
+                swatch = ColorSwatch(
+                    (x, y, swatch_width, 40),
+                    color, label, self.font
+                )
+                self.color_swatches[key] = swatch
+                self.swatch_grid[(col, row)] = key
+
+            self.swatch_col2_x = col2_x
+
+        elif tab == 2:  # Keybinds
+            # Keybind inputs - two columns
+            self.keybind_labels = {
+                'quit': 'Quit:',
+                'pause': 'Pause:',
+                'single_channel': 'Single Channel:',
+                'auto_scale': 'Auto Scale:',
+                'fit_window': 'Fit Window:',
+                'reset_view': 'Reset View:',
+                'cycle_mode': 'Cycle Mode:',
+                'settings': 'Settings:',
+            }
+
+            keybinds = self.config.get('keybinds')
+            self.keybind_order = tuple(keybinds)
+            items_per_col = (len(keybinds) + 1) // 2
+
+            for i, (name, key_str) in enumerate(keybinds.items()):
+                col = i // items_per_col
+                row = i % items_per_col
+
+                x = col1_x if col == 0 else col2_x
+                y = self.content_y + 20 + row * 60
+
+                self.keybind_inputs[name] = InputBox(
+                    (x + 200, y, 120, 40),
+                    key_str,
+                    self.font
+                )
+
+        elif tab == 3:  # Serial
+            self.serial_input = InputBox(
+                (col1_x + 180, self.content_y + 30, min(400, self.content_width - 300), 40),
+                self.config.get('serial_port'),
+                self.font
+            )
 
     def show(self):
         """Show the settings window"""
         self.active = True
+        self.dirty = True
 
     def hide(self):
         """Hide the settings window"""
@@ -614,18 +803,10 @@ class SettingsWindow:
         if not self.active:
             return
 
-        # Full screen dark background
-        screen.fill(BLACK)
-
-        # Title bar background
-        title_bar_rect = pygame.Rect(0, 0, self.width, 60)
-        pygame.draw.rect(screen, DARK_GRAY, title_bar_rect)
-        pygame.draw.line(screen, GRAY, (0, 60), (self.width, 60), 2)
+        self.active_settings_window = self.tab_titles[self.tab]
 
-        # Title
-        title = self.title_font.render(self.active_settings_window, True, WHITE)
-        title_rect = title.get_rect(center=(self.width // 2, 30))
-        screen.blit(title, title_rect)
+        # Everything that doesn't change while the tab is open comes pre-drawn
+        screen.blit(self._get_static_background(), (0, 0))
 
         # Tab buttons
         for i, button in enumerate(self.tab_buttons):
@@ -635,80 +816,111 @@ class SettingsWindow:
                 button.color = MID_GRAY
             button.draw(screen)
 
-        # Draw content based on active tab
+        # Interactive widgets of the active tab
         if self.tab == 0:  # Display
-            self.active_settings_window = self.display_settings_text
-            self._draw_display_settings(screen)
+            self.width_input.draw(screen)
+            self.height_input.draw(screen)
         elif self.tab == 1:  # Colors
-            self.active_settings_window = self.color_settings_text
-            self._draw_color_settings(screen)
+            for swatch in self.color_swatches.values():
+                swatch.draw_swatch(screen)
         elif self.tab == 2:  # Keybinds
-            self.active_settings_window = self.keybinds_settings_text
-            self._draw_keybind_settings(screen)
+            for input_box in self.keybind_inputs.values():
+                input_box.draw(screen)
         elif self.tab == 3:  # Serial
-            self.active_settings_window = self.serial_settings_text
-            self._draw_serial_settings(screen)
+            self.serial_input.draw(screen)
 
         # Bottom buttons
         self.save_button.draw(screen)
         self.cancel_button.draw(screen)
 
+        # Draw color picker on top of everything
+        self.color_picker.draw(screen)
+
+        self.dirty = False
+
+    def _get_static_background(self):
+        """Return the active tab's static chrome, drawing it on first use after a layout change"""
+        surf = self.static_backgrounds.get(self.tab)
+        if surf is not None:
+            return surf
+
+        surf = pygame.Surface((self.width, self.height))
+
+        # Full screen dark background
+        surf.fill(BLACK)
+
+        # Title bar background
+        title_bar_rect = pygame.Rect(0, 0, self.width, 60)
+        surf.fill(DARK_GRAY, title_bar_rect)
+        pygame.draw.line(surf, GRAY, (0, 60), (self.width, 60), 2)
+
+        # Title
+        title = render_text(self.title_font, self.active_settings_window, WHITE)
+        title_rect = title.get_rect(center=(self.width // 2, 30))
+        surf.blit(title, title_rect)
+
+        # Draw content based on active tab
+        if self.tab == 0:  # Display
+            self._draw_display_settings(surf)
+        elif self.tab == 1:  # Colors
+            self._draw_color_settings(surf)
+        elif self.tab == 2:  # Keybinds
+            self._draw_keybind_settings(surf)
+        elif self.tab == 3:  # Serial
+            self._draw_serial_settings(surf)
+
         # Instructions at bottom
         instruction_text = "ESC to cancel  |  Click Save to apply changes"
-        instruction_surf = self.small_font.render(instruction_text, True, LIGHT_GRAY)
+        instruction_surf = render_text(self.small_font, instruction_text, LIGHT_GRAY)
         instruction_rect = instruction_surf.get_rect(center=(self.width // 2, self.height - 90))
-        screen.blit(instruction_surf, instruction_rect)
+        surf.blit(instruction_surf, instruction_rect)
 
-        # Draw color picker on top of everything
-        self.color_picker.draw(screen)
+        self.static_backgrounds[self.tab] = surf
+        return surf
 
     def _draw_display_settings(self, screen):
         col1_x = self.content_x + 40
         y = self.content_y + 30
 
-        label = self.font.render('Window Width:', True, WHITE)
+        label = render_text(self.font, 'Window Width:', WHITE)
         screen.blit(label, (col1_x, y + 10))
-        self.width_input.draw(screen)
 
-        label = self.font.render('Window Height:', True, WHITE)
+        label = render_text(self.font, 'Window Height:', WHITE)
         screen.blit(label, (col1_x, y + 70))
-        self.height_input.draw(screen)
 
         # Info box
         info_y = y + 150
         info_rect = pygame.Rect(col1_x, info_y, self.content_width - 80, 80)
-        pygame.draw.rect(screen, DARK_GRAY, info_rect)
+        screen.fill(DARK_GRAY, info_rect)
         pygame.draw.rect(screen, YELLOW, info_rect, 2)
 
-        info = self.font.render('Note: Window size changes require application restart', True, YELLOW)
+        info = render_text(self.font, 'Note: Window size changes require application restart', YELLOW)
         screen.blit(info, (col1_x + 20, info_y + 20))
 
-        info2 = self.small_font.render('You can also resize the window by dragging the window edges', True, LIGHT_GRAY)
+        info2 = render_text(self.small_font, 'You can also resize the window by dragging the window edges', LIGHT_GRAY)
         screen.blit(info2, (col1_x + 20, info_y + 50))
 
     def _draw_color_settings(self, screen):
-
-        # Draw all color swatches
-        for swatch in self.color_swatches.values():
-            swatch.draw(screen)
+        # Swatch labels in one batched blit; the color boxes are drawn per frame
+        screen.blits([(swatch.label_surf, swatch.label_pos) for swatch in self.color_swatches.values()],
+                     doreturn=False)
 
         # Instruction box at bottom of content
         info_y = self.content_y + self.content_height - 80
         info_rect = pygame.Rect(self.content_x + 40, info_y, self.content_width - 80, 60)
-        pygame.draw.rect(screen, DARK_GRAY, info_rect)
+        screen.fill(DARK_GRAY, info_rect)
         pygame.draw.rect(screen, BLUE, info_rect, 2)
 
-        info = self.font.render('Click any color box to customize', True, LIGHT_GRAY)
+        info = render_text(self.font, 'Click any color box to customize', LIGHT_GRAY)
         screen.blit(info, (self.content_x + 60, info_y + 18))
 
     def _draw_keybind_settings(self, screen):
         col1_x = self.content_x + 40
         col2_x = self.content_x + self.content_width // 2 + 20
 
-        keybind_names = list(self.keybind_inputs.keys())
-        items_per_col = (len(keybind_names) + 1) // 2
+        items_per_col = (len(self.keybind_order) + 1) // 2
 
-        for i, name in enumerate(keybind_names):
+        for i, name in enumerate(self.keybind_order):
             col = i // items_per_col
             row = i % items_per_col
 
@@ -716,41 +928,37 @@ class SettingsWindow:
             y = self.content_y + 20 + row * 60
 
             label_text = self.keybind_labels.get(name, name + ':')
-            label = self.font.render(label_text, True, WHITE)
+            label = render_text(self.font, label_text, WHITE)
             screen.blit(label, (x, y + 8))
 
-            if name in self.keybind_inputs:
-                self.keybind_inputs[name].draw(screen)
-
         # Info box
         info_y = self.content_y + self.content_height - 100
         info_rect = pygame.Rect(self.content_x + 40, info_y, self.content_width - 80, 80)
-        pygame.draw.rect(screen, DARK_GRAY, info_rect)
+        screen.fill(DARK_GRAY, info_rect)
         pygame.draw.rect(screen, BLUE, info_rect, 2)
 
-        info = self.font.render('Click a keybind box and type the new key', True, LIGHT_GRAY)
+        info = render_text(self.font, 'Click a keybind box and type the new key', LIGHT_GRAY)
         screen.blit(info, (self.content_x + 60, info_y + 15))
 
-        info2 = self.small_font.render('Supported: letters (a-z), space, f1-f12, escape', True, LIGHT_GRAY)
+        info2 = render_text(self.small_font, 'Supported: letters (a-z), space, f1-f12, escape', LIGHT_GRAY)
         screen.blit(info2, (self.content_x + 60, info_y + 48))
 
     def _draw_serial_settings(self, screen):
         col1_x = self.content_x + 40
         y = self.content_y + 30
 
-        label = self.font.render('Serial Port:', True, WHITE)
+        label = render_text(self.font, 'Serial Port:', WHITE)
         screen.blit(label, (col1_x, y + 10))
-        self.serial_input.draw(screen)
 
         # Info boxes
         info_y = y + 100
 
         # Platform examples
         example_rect = pygame.Rect(col1_x, info_y, self.content_width - 80, 140)
-        pygame.draw.rect(screen, DARK_GRAY, example_rect)
+        screen.fill(DARK_GRAY, example_rect)
         pygame.draw.rect(screen, BLUE, example_rect, 2)
 
-        example_title = self.font.render('Platform Examples:', True, WHITE)
+        example_title = render_text(self.font, 'Platform Examples:', WHITE)
         screen.blit(example_title, (col1_x + 20, info_y + 15))
 
         examples = [
@@ -760,16 +968,16 @@ class SettingsWindow:
         ]
 
         for i, example in enumerate(examples):
-            ex_surf = self.small_font.render(example, True, LIGHT_GRAY)
+            ex_surf = render_text(self.small_font, example, LIGHT_GRAY)
             screen.blit(ex_surf, (col1_x + 40, info_y + 55 + i * 25))
 
         # Connection status
         status_y = info_y + 160
         status_rect = pygame.Rect(col1_x, status_y, self.content_width - 80, 60)
-        pygame.draw.rect(screen, DARK_GRAY, status_rect)
+        screen.fill(DARK_GRAY, status_rect)
         pygame.draw.rect(screen, YELLOW, status_rect, 2)
 
-        status = self.font.render('Note: Serial port changes require reconnection', True, YELLOW)
+        status = render_text(self.font, 'Note: Serial port changes require reconnection', YELLOW)
         screen.blit(status, (col1_x + 20, status_y + 18))
 
     def update(self, dt):
@@ -777,18 +985,22 @@ class SettingsWindow:
         if not self.active:
             return
 
-        # Update all input boxes
-        self.width_input.update(dt)
-        self.height_input.update(dt)
-        for input_box in self.keybind_inputs.values():
-            input_box.update(dt)
-        self.serial_input.update(dt)
+        # Only the visible tab's input boxes can blink
+        changed = False
+        for input_box in self._tab_inputs():
+            changed |= input_box.update(dt)
+
+        if changed:
+            self.dirty = True
 
     def handle_event(self, event):
         """Handle events, returns True if settings were saved"""
         if not self.active:
             return False
 
+        # Hover, typing, dragging and clicks all change what is shown
+        self.dirty = True
+
         # Color picker gets first priority
         if self.color_picker.active:
             result = self.color_picker.handle_event(event)
@@ -800,10 +1012,20 @@ class SettingsWindow:
                 self.editing_color = None
             return False
 
+        # Everything below only reacts to mouse motion, clicks and key presses
+        event_type = event.type
+        if event_type not in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN):
+            return False
+
         # Tab switching
         for i, button in enumerate(self.tab_buttons):
             if button.handle_event(event):
                 self.tab = i
+                self._init_tab(i)
+                # Drop the focus so a box on the old tab doesn't stay drawn as focused
+                if self.active_input is not None:
+                    self.active_input.active = False
+                    self.active_input = None
                 return False
 
         # Save/Cancel buttons
@@ -817,40 +1039,69 @@ class SettingsWindow:
             return False
 
         # Tab-specific widgets
-        if self.tab == 0:  # Display
-            self.width_input.handle_event(event)
-            self.height_input.handle_event(event)
-
-        elif self.tab == 1:  # Colors
-            for key, swatch in self.color_swatches.items():
-                if swatch.handle_event(event):
-                    # Open color picker for this color
-                    self.editing_color = key
-                    self.color_picker.show(swatch.color)
-                    break
-
-        elif self.tab == 2:  # Keybinds
-            for input_box in self.keybind_inputs.values():
+        if self.tab == 1:  # Colors
+            if event_type != pygame.KEYDOWN:
+                # Only the swatch in the grid cell under the mouse can react
+                key = self._swatch_at(event.pos)
+                if event_type == pygame.MOUSEMOTION and self.hovered_swatch != key:
+                    if self.hovered_swatch is not None:
+                        self.color_swatches[self.hovered_swatch].hovered = False
+                    self.hovered_swatch = key
+                if key is not None:
+                    swatch = self.color_swatches[key]
+                    if swatch.handle_event(event):
+                        # Open color picker for this color
+                        self.editing_color = key
+                        self.color_picker.show(swatch.color)
+
+        elif event_type == pygame.MOUSEBUTTONDOWN:
+            # Clicks move the focus; remember the box that took it
+            self.active_input = None
+            for input_box in self._tab_inputs():
                 input_box.handle_event(event)
+                if input_box.active:
+                    self.active_input = input_box
 
-        elif self.tab == 3:  # Serial
-            self.serial_input.handle_event(event)
+        elif event_type == pygame.KEYDOWN and self.active_input is not None:
+            # Only the focused box can consume typing
+            self.active_input.handle_event(event)
+            if not self.active_input.active:
+                self.active_input = None
 
         # ESC to close
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+        if event_type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             if not self.color_picker.active:  # Don't close if color picker is open
                 self.hide()
 
         return False
 
+    def _swatch_at(self, pos):
+        """Key of the color swatch whose layout cell contains pos, or None"""
+        mx, my = pos
+        col = 0 if mx < self.swatch_col2_x else 1
+        row = (my - self.content_y - 20) // 50
+        return self.swatch_grid.get((col, row))
+
+    def _tab_inputs(self):
+        """Input boxes on the active tab"""
+        if self.tab == 0:  # Display
+            return (self.width_input, self.height_input)
+        elif self.tab == 2:  # Keybinds
+            return tuple(self.keybind_inputs.values())
+        elif self.tab == 3:  # Serial
+            return (self.serial_input,)
+        return ()
+
     def _save_settings(self):
         """Save all settings to config"""
+        # Tabs that were never opened keep their configured values
         # Display
-        try:
-            self.config.set(int(self.width_input.text), 'window_width')
-            self.config.set(int(self.height_input.text), 'window_height')
-        except ValueError:
-            pass
+        if self.width_input is not None:
+            try:
+                self.config.set(int(self.width_input.text), 'window_width')
+                self.config.set(int(self.height_input.text), 'window_height')
+            except ValueError:
+                pass
 
         # Colors
         for name, swatch in self.color_swatches.items():
@@ -861,13 +1112,22 @@ class SettingsWindow:
             self.config.set(input_box.text.lower(), 'keybinds', name)
 
         # Serial
-        self.config.set(self.serial_input.text, 'serial_port')
+        if self.serial_input is not None:
+            self.config.set(self.serial_input.text, 'serial_port')
 
         # Save to file
         self.config.save_config()
 
 
 class CurveTracerDual:
+    # Sweep commands indexed by "store as weak"
+    COMMANDS = (b'T', b'W')
+    MODE_NAMES = ("4.7K(T)", "100K WEAK(W)", "ALT")
+    MODE_DESCRIPTIONS = ("4.7K Ohm (T)", "100K Ohm WEAK (W)", "Alternating (T+W)")
+    # Keyboard actions, highest priority first when two share a key
+    KEY_ACTIONS = ('quit', 'cycle_mode', 'pause', 'single_channel', 'auto_scale',
+                   'fit_window', 'reset_view', 'settings')
+
     def __init__(self):
         # Load configuration
         self.config = ConfigManager()
@@ -882,10 +1142,15 @@ class CurveTracerDual:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 28)
         self.small_font = pygame.font.Font(None, 20)
+        self.overlay_font = pygame.font.Font(None, 72)
         self.serial = None
+        self.input_stale = False  # Set when a frame was cut short and bytes may linger
+        self.colors_version = None
+        self.read_chunk_size = 4096
 
-        # Get colors from config
+        # Get colors and keybinds from config
         self._load_colors()
+        self._load_keymap()
 
         # Data - per manual: 336 points per channel from 1008 total samples
         self.ch1_std = []
@@ -906,8 +1171,37 @@ class CurveTracerDual:
         self.ch2_voltage = []
         self.drive_voltage = []
 
+        # Preallocated storage the lists above are pointed at once data arrives:
+        # one frame per mode, each row (see ROW_*) a contiguous channel
+        self.frame_bytes = bytearray(FRAME_BYTES)  # Raw serial frame, filled in place
+        self.sample_buffer = np.empty(FRAME_SAMPLES, dtype=np.int16)
+        self.std_frame = np.empty((5, CHANNEL_POINTS), dtype=np.int16)
+        self.weak_frame = np.empty((5, CHANNEL_POINTS), dtype=np.int16)
+        self.points_buffer = np.empty((CHANNEL_POINTS, 2), dtype=np.int32)
+        self.norm_buffer = np.empty((2, CHANNEL_POINTS), dtype=np.float64)
+        self.trace_cache = {}  # (weak, channel) -> (view, projected points)
+
+        # (min, max[, mean]) of the active data, updated by acquire()
+        self.ch1_stats = None
+        self.ch2_stats = None
+        self.ch1_voltage_stats = None
+        self.ch2_voltage_stats = None
+        self.drive_voltage_stats = None
+
+        # (x_min, x_max, y_min, y_max) per mode and for the active data
+        self.range_std = None
+        self.range_weak = None
+        self.data_range = None
+
         self.frame_count = 0
         self.fps = 0
+        self.info_text = None
+        self.info_surf = None
+        self.status_text = None
+        self.status_surf = None
+        self.conn_surfs = {}  # connected -> rendered serial status
+        self.title_text = None
+        self.title_surf = None
 
         self.alt_use_weak = False
         self.last_mode_was_weak = False
@@ -932,37 +1226,92 @@ class CurveTracerDual:
         # Settings button - positioned relative to window size
         self._update_settings_button_position()
 
+        # Compile the projection kernel now rather than on the first frame
+        if NUMBA_AVAILABLE:
+            dummy = np.zeros(CHANNEL_POINTS, dtype=np.int16)
+            self._project_points(dummy, dummy, pygame.Rect(0, 0, 1, 1), 0.0, 1.0, 0.0, 1.0,
+                                 self.points_buffer, self.norm_buffer)
+
     def auto_detect_port(self):
         """Try to auto-detect CurveBug on available ports"""
-        import serial.tools.list_ports
-
         ports = [port.device for port in serial.tools.list_ports.comports()]
+        if not ports:
+            return None
 
-        for port in ports:
+        # Each probe mostly sleeps or waits on its port, so up to PROBE_WORKERS run
+        # at once. Results are taken in enumeration order, so the first CurveBug
+        # in the list wins as when probing one by one. Once it answers, probes not
+        # yet started are cancelled; running ones that haven't sent b'T' yet stop
+        # first, but ones already waiting for a reply finish their read.
+        found = threading.Event()
+        with ThreadPoolExecutor(max_workers=min(len(ports), PROBE_WORKERS)) as pool:
+            futures = [pool.submit(self._probe_port, port, found) for port in ports]
+            for port, future in zip(ports, futures):
+                if future.result():
+                    found.set()
+                    for other in futures:
+                        other.cancel()
+                    debug_print(f"Auto-detected CurveBug on {port}")
+                    return port
+
+        return None
+
+    def _probe_port(self, port, found):
+        """True if port answers a sweep request with a full frame; skipped once found is set"""
+        if found.is_set():
+            return False
+        try:
+            test_serial = serial.Serial(port, 115200, timeout=1)
             try:
-                test_serial = serial.Serial(port, 115200, timeout=1)
                 time.sleep(0.1)
+                if found.is_set():
+                    return False
                 test_serial.reset_input_buffer()
                 test_serial.write(b'T')
-
-                data = bytearray()
-                start = time.time()
-                while len(data) < 2016 and time.time() - start < 1.0:
-                    if test_serial.in_waiting > 0:
-                        data.extend(test_serial.read(min(test_serial.in_waiting, 2016 - len(data))))
-
+                filled = self._read_exactly(test_serial, bytearray(FRAME_BYTES), 1.0)
+            finally:
                 test_serial.close()
+            return filled == FRAME_BYTES
+        except Exception:
+            return False
 
-                if len(data) == 2016:
-                    debug_print(f"Auto-detected CurveBug on {port}")
-                    return port
-            except:
-                continue
-
-        return None
+    def _read_exactly(self, port, buf, timeout):
+        """Fill buf from port, giving up after timeout seconds; returns the bytes filled
+
+        Each readinto() blocks in pyserial, so there is no in_waiting polling
+        loop in Python. The port timeout is shrunk to the time left before each
+        call, so a slowly trickling frame can't overrun the deadline. pyserial
+        implements readinto() as read() plus a slice assignment, so this costs
+        the same as reading and copying each chunk into buf by hand.
+        """
+        view = memoryview(buf)
+        size = len(buf)
+        chunk_size = self.read_chunk_size
+        readinto = port.readinto
+        monotonic = time.monotonic
+        filled = 0
+        deadline = monotonic() + timeout
+        port_timeout = port.timeout
+        try:
+            while filled < size:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                port.timeout = remaining
+                count = readinto(view[filled:filled + chunk_size])
+                if not count:
+                    break
+                filled += count
+        finally:
+            port.timeout = port_timeout
+        return filled
 
     def _load_colors(self):
-        """Load colors from config"""
+        """Load colors from config, unless they are unchanged since the last load"""
+        if self.colors_version == self.config.colors_version:
+            return
+        self.colors_version = self.config.colors_version
+
         colors = self.config.get('colors')
         self.BACKGROUND_COLOR = tuple(colors['background'])
         self.DUT1_COLOR = tuple(colors['dut1_trace'])
@@ -977,6 +1326,31 @@ class CurveTracerDual:
         self.BORDER_COLOR = tuple(colors['border'])
         self.DUT_VOLTAGE_COLOR = tuple(colors['dut_voltage'])
 
+        self.grid_surf = None
+        self.grid_surf_size = None
+        self.tick_label_values = None
+        self.tick_label_surfs = []
+        self.stats_key = None
+        self.stats_surf = None
+        self._render_static_text()
+
+    def _render_static_text(self):
+        """Pre-render text that only changes when the colors do"""
+        self.no_data_surf = self.font.render("No Data", True, WHITE)
+        self.x_title_surf = self.font.render("DUT Voltage", True, self.AXIS_TITLE_COLOR)
+        self.y_title_surf = self.font.render("Current", True, self.AXIS_TITLE_COLOR)
+        self.dut1_legend_surf = self.font.render("DUT1 (CH1 - Black Lead)", True, self.DUT1_COLOR)
+        self.dut2_legend_surf = self.font.render("DUT2 (CH2 - Red Lead)", True, self.DUT2_COLOR)
+
+        status = "Controls: SPACE=mode P=pause S=single A=auto F=fit R=reset F1=settings | Drag=pan Wheel=zoom"
+        self.controls_surf = self.small_font.render(status, True, GRAY)
+
+        self.pause_surf = self.overlay_font.render("PAUSED", True, YELLOW)
+        self.pause_bg_surf = pygame.Surface((self.pause_surf.get_width() + 40,
+                                             self.pause_surf.get_height() + 20))
+        self.pause_bg_surf.set_alpha(200)
+        self.pause_bg_surf.fill(BLACK)
+
     def _update_settings_button_position(self):
         """Update settings button position based on window size"""
         self.settings_button = Button(
@@ -998,9 +1372,16 @@ class CurveTracerDual:
         debug_print(f"Window resized to {new_width}x{new_height}")
 
     def connect(self):
+        # Largest single read() issued while collecting a frame
+        try:
+            chunk_size = int(self.config.get('serial_read_chunk_size'))
+        except (TypeError, ValueError):
+            chunk_size = ConfigManager.DEFAULT_CONFIG['serial_read_chunk_size']
+            debug_print(f"Invalid serial_read_chunk_size, using {chunk_size}")
+        self.read_chunk_size = max(1, chunk_size)
         try:
             port = self.config.get('serial_port')
-            self.serial = serial.Serial(port, 115200, timeout=1)
+            self.serial = serial.Serial(port, 115200, timeout=READ_DEADLINE)
             time.sleep(0.1)
             self.serial.reset_input_buffer()
             debug_print(f"Connected to {port}")
@@ -1012,7 +1393,7 @@ class CurveTracerDual:
             detected = self.auto_detect_port()
             if detected:
                 try:
-                    self.serial = serial.Serial(detected, 115200, timeout=1)
+                    self.serial = serial.Serial(detected, 115200, timeout=READ_DEADLINE)
                     time.sleep(0.1)
                     self.serial.reset_input_buffer()
                     debug_print(f"Auto-connected to {detected}")
@@ -1024,6 +1405,17 @@ class CurveTracerDual:
 
             return False
 
+    def _load_keymap(self):
+        """Resolve every configured keybind once into a pygame key -> action map"""
+        self.action_by_key = {}
+        # Lowest priority first, so a higher priority action overwrites a shared key
+        for action in reversed(self.KEY_ACTIONS):
+            try:
+                self.action_by_key[self.get_key_from_config(action)] = action
+            except (TypeError, AttributeError):
+                debug_print(f"Ignoring unsupported key for {action}: {self.config.get('keybinds', action)!r}")
+        self.action_by_key[pygame.K_ESCAPE] = 'quit'
+
     def get_key_from_config(self, action):
         """Get pygame key constant from config"""
         key_str = self.config.get('keybinds', action)
@@ -1039,103 +1431,108 @@ class CurveTracerDual:
     def acquire(self):
         """Acquire data from CurveBug"""
         # Allow app to run without connection
-        if self.serial is None or not self.serial.is_open:
+        ser = self.serial
+        if ser is None or not ser.is_open:
             return False
         try:
-            if self.excitation_mode == 0:
-                command = b'T'
-                store_as_weak = False
-            elif self.excitation_mode == 1:
-                command = b'W'
-                store_as_weak = True
+            mode = self.excitation_mode
+            if mode == 2:
+                store_as_weak = self.alt_use_weak
+                self.alt_use_weak = not store_as_weak
             else:
-                if self.alt_use_weak:
-                    command = b'W'
-                    store_as_weak = True
-                else:
-                    command = b'T'
-                    store_as_weak = False
-                self.alt_use_weak = not self.alt_use_weak
-
-            self.serial.reset_input_buffer()
-            self.serial.write(command)
-
-            data = bytearray()
-            start = time.time()
-            while len(data) < 2016:
-                if time.time() - start > 0.5:
-                    break
-                if self.serial.in_waiting > 0:
-                    data.extend(self.serial.read(min(self.serial.in_waiting, 2016 - len(data))))
-
-            if len(data) != 2016:
-                return False
-
-            values = []
-            for i in range(0, len(data), 2):
-                val = struct.unpack('<H', data[i:i + 2])[0]
-                values.append(val & 0x0FFF)
-
-            if len(values) != 1008:
+                store_as_weak = mode == 1
+
+            # Request/response keeps the input empty; only flush after a bad frame
+            if self.input_stale:
+                ser.reset_input_buffer()
+                self.input_stale = False
+            elif OUTPUT_DEBUG_TEXT and ser.in_waiting:
+                debug_print(f"{ser.in_waiting} unexpected bytes before request")
+            ser.write(self.COMMANDS[store_as_weak])
+
+            if self._read_exactly(ser, self.frame_bytes, READ_DEADLINE) != FRAME_BYTES:
+                self.input_stale = True
                 return False
 
-            drive_voltage = values[0::3]
-            ch1_raw = values[1::3]
-            ch2_raw = values[2::3]
-
-            ch1_current = [drive_voltage[i] - ch1_raw[i] for i in range(len(drive_voltage))]
-            ch2_current = [drive_voltage[i] - ch2_raw[i] for i in range(len(drive_voltage))]
+            # 1008 little-endian 12-bit samples, interleaved drive/ch1/ch2;
+            # FRAME_BYTES already guarantees FRAME_SAMPLES of them
+            samples = np.frombuffer(self.frame_bytes, dtype=SAMPLE_DTYPE)
+            values = np.bitwise_and(samples, 0x0FFF, out=self.sample_buffer)
+            columns = values.reshape(CHANNEL_POINTS, 3)
 
+            # Decode into this mode's persistent buffers rather than new arrays, and
+            # make them the mode-specific and active data in the same branch
             if store_as_weak:
-                self.ch1_voltage_weak = ch1_raw
-                self.ch2_voltage_weak = ch2_raw
-                self.ch1_weak = ch1_current
-                self.ch2_weak = ch2_current
-                self.drive_voltage_weak = drive_voltage
-                self.last_mode_was_weak = True
+                frame = self.weak_frame
+                drive_voltage, ch1_raw, ch2_raw, ch1_current, ch2_current = frame
+                self.ch1_voltage = self.ch1_voltage_weak = ch1_raw
+                self.ch2_voltage = self.ch2_voltage_weak = ch2_raw
+                self.ch1 = self.ch1_weak = ch1_current
+                self.ch2 = self.ch2_weak = ch2_current
+                self.drive_voltage = self.drive_voltage_weak = drive_voltage
             else:
-                self.ch1_voltage_std = ch1_raw
-                self.ch2_voltage_std = ch2_raw
-                self.ch1_std = ch1_current
-                self.ch2_std = ch2_current
-                self.drive_voltage_std = drive_voltage
-                self.last_mode_was_weak = False
-
+                frame = self.std_frame
+                drive_voltage, ch1_raw, ch2_raw, ch1_current, ch2_current = frame
+                self.ch1_voltage = self.ch1_voltage_std = ch1_raw
+                self.ch2_voltage = self.ch2_voltage_std = ch2_raw
+                self.ch1 = self.ch1_std = ch1_current
+                self.ch2 = self.ch2_std = ch2_current
+                self.drive_voltage = self.drive_voltage_std = drive_voltage
+            self.last_mode_was_weak = store_as_weak
+
+            # Points projected from the frame being overwritten are stale now
+            self.trace_cache.pop((store_as_weak, 1), None)
+            self.trace_cache.pop((store_as_weak, 2), None)
+
+            # Transpose the interleaved columns into the drive/V1/V2 rows
+            np.copyto(frame[ROW_DRIVE:ROW_V2 + 1], columns.T)
+
+            # Both currents at once; 12-bit differences (-4095..4095) always fit in int16
+            np.subtract(drive_voltage, frame[ROW_V1:ROW_V2 + 1], out=frame[ROW_I1:ROW_I2 + 1],
+                        dtype=np.int16)
+
+            # Info panel statistics for every row in one reduction each
+            mins = frame.min(axis=1).tolist()
+            maxs = frame.max(axis=1).tolist()
+            means = frame[ROW_I1:ROW_I2 + 1].mean(axis=1).tolist()
+            self.ch1_stats = (mins[ROW_I1], maxs[ROW_I1], means[0])
+            self.ch2_stats = (mins[ROW_I2], maxs[ROW_I2], means[1])
+            self.ch1_voltage_stats = (mins[ROW_V1], maxs[ROW_V1])
+            self.ch2_voltage_stats = (mins[ROW_V2], maxs[ROW_V2])
+            self.drive_voltage_stats = (mins[ROW_DRIVE], maxs[ROW_DRIVE])
+
+            # Combined (x_min, x_max, y_min, y_max) of both channels for auto-scale
+            self.data_range = (
+                min(mins[ROW_V1], mins[ROW_V2]),
+                max(maxs[ROW_V1], maxs[ROW_V2]),
+                min(mins[ROW_I1], mins[ROW_I2]),
+                max(maxs[ROW_I1], maxs[ROW_I2]),
+            )
             if store_as_weak:
-                self.ch1_voltage = self.ch1_voltage_weak
-                self.ch2_voltage = self.ch2_voltage_weak
-                self.ch1 = self.ch1_weak
-                self.ch2 = self.ch2_weak
-                self.drive_voltage = self.drive_voltage_weak
+                self.range_weak = self.data_range
             else:
-                self.ch1_voltage = self.ch1_voltage_std
-                self.ch2_voltage = self.ch2_voltage_std
-                self.ch1 = self.ch1_std
-                self.ch2 = self.ch2_std
-                self.drive_voltage = self.drive_voltage_std
+                self.range_std = self.data_range
 
             return True
 
         except Exception as e:
             debug_print(f"Error: {e}")
+            self.input_stale = True
             return False
 
     def fit_to_window(self):
         """Calculate zoom and pan to show all data"""
-        if not self.ch1 or not self.ch2:
+        if len(self.ch1) == 0 or len(self.ch2) == 0:
             return
 
+        # Per-mode extents were already reduced by acquire(); just fold them
         if self.excitation_mode == 2 and len(self.ch1_std) > 0 and len(self.ch1_weak) > 0:
-            all_x = self.ch1_voltage_std + self.ch2_voltage_std + self.ch1_voltage_weak + self.ch2_voltage_weak
-            all_y = self.ch1_std + self.ch2_std + self.ch1_weak + self.ch2_weak
+            data_x_min = min(self.range_std[0], self.range_weak[0])
+            data_x_max = max(self.range_std[1], self.range_weak[1])
+            data_y_min = min(self.range_std[2], self.range_weak[2])
+            data_y_max = max(self.range_std[3], self.range_weak[3])
         else:
-            all_x = self.ch1_voltage + self.ch2_voltage
-            all_y = self.ch1 + self.ch2
-
-        data_x_min = min(all_x)
-        data_x_max = max(all_x)
-        data_y_min = min(all_y)
-        data_y_max = max(all_y)
+            data_x_min, data_x_max, data_y_min, data_y_max = self.data_range
 
         x_margin = (data_x_max - data_x_min) * 0.2
         y_margin = (data_y_max - data_y_min) * 0.2
@@ -1182,81 +1579,130 @@ class CurveTracerDual:
         self.pan_offset_y = 0.0
         debug_print("View reset to default")
 
-    def draw_trace(self, ch1_voltage, ch2_voltage, ch1_current, ch2_current,
-                   color1, color2, rect, x_min, x_max, y_min, y_max, line_width=3):
-        """Draw trace curves"""
-        points1 = []
-        for i in range(len(ch1_voltage)):
-            x_norm = (ch1_voltage[i] - x_min) / (x_max - x_min) if x_max != x_min else 0.5
-            y_norm = (ch1_current[i] - y_min) / (y_max - y_min) if y_max != y_min else 0.5
+    @staticmethod
+    def _project_points(voltage, current, rect, x_min, x_max, y_min, y_max, out, scratch):
+        """Map voltage/current samples to screen pixels (X inverted)
+
+        Points outside rect keep their position out to NORM_MIN/NORM_MAX plot
+        sizes, so the int32 cast can't overflow; the caller clips the drawing.
+
+        out is an (N, 2) int32 scratch array; pygame.draw.lines wants a sequence
+        of pairs and tolist() builds that in C instead of a tuple per point.
+        scratch is a (2, N) float64 array for the NumPy path's normalized values.
+        """
+        n = len(voltage)
+        out = out[:n]
+
+        if NUMBA_AVAILABLE:
+            _project_kernel(np.asarray(voltage), np.asarray(current), out,
+                            float(x_min), float(x_max), float(y_min), float(y_max),
+                            rect.right, rect.width, rect.top, rect.height)
+            return out.tolist()
+
+        x_norm = scratch[0, :n]
+        y_norm = scratch[1, :n]
+        if x_max != x_min:
+            np.subtract(voltage, x_min, out=x_norm, dtype=np.float64)
+            x_norm /= x_max - x_min
+        else:
+            x_norm.fill(0.5)
+        if y_max != y_min:
+            np.subtract(current, y_min, out=y_norm, dtype=np.float64)
+            y_norm /= y_max - y_min
+        else:
+            y_norm.fill(0.5)
 
-            px = int(rect.right - (x_norm * rect.width))
-            py = int(rect.top + (y_norm * rect.height))
-            points1.append((px, py))
+        norm = scratch[:, :n]
+        np.clip(norm, NORM_MIN, NORM_MAX, out=norm)
 
-        if len(points1) > 1:
-            pygame.draw.lines(self.screen, color1, False, points1, line_width)
+        # Assigning into the int32 columns truncates like int() did
+        out[:, 0] = rect.right - x_norm * rect.width
+        out[:, 1] = rect.top + y_norm * rect.height
+        return out.tolist()
 
-        if not self.single_channel:
-            points2 = []
-            for i in range(len(ch2_voltage)):
-                x_norm = (ch2_voltage[i] - x_min) / (x_max - x_min) if x_max != x_min else 0.5
-                y_norm = (ch2_current[i] - y_min) / (y_max - y_min) if y_max != y_min else 0.5
+    def _trace_points(self, key, voltage, current, rect, x_min, x_max, y_min, y_max):
+        """Projected points for one channel, reused while its data and the view are unchanged"""
+        view = (rect.x, rect.y, rect.width, rect.height, x_min, x_max, y_min, y_max)
+        cached = self.trace_cache.get(key)
+        if cached is not None and cached[0] == view:
+            return cached[1]
+
+        points = self._project_points(voltage, current, rect, x_min, x_max, y_min, y_max,
+                                      self.points_buffer, self.norm_buffer)
+        self.trace_cache[key] = (view, points)
+        return points
+
+    def draw_trace(self, ch1_voltage, ch2_voltage, ch1_current, ch2_current,
+                   color1, color2, rect, x_min, x_max, y_min, y_max, line_width=3, weak=False):
+        """Draw trace curves (DUT2 is neither projected nor drawn in single channel mode)
+
+        weak says which mode's data is passed, so cached points are only reused
+        until acquire() replaces that mode's frame.
+        """
+        screen = self.screen
+        draw_lines = pygame.draw.lines
+
+        if len(ch1_voltage) > 1:
+            points1 = self._trace_points((weak, 1), ch1_voltage, ch1_current, rect,
+                                         x_min, x_max, y_min, y_max)
+            draw_lines(screen, color1, False, points1, line_width)
 
-                px = int(rect.right - (x_norm * rect.width))
-                py = int(rect.top + (y_norm * rect.height))
-                points2.append((px, py))
+        if self.single_channel:
+            return
 
-            if len(points2) > 1:
-                pygame.draw.lines(self.screen, color2, False, points2, line_width)
+        if len(ch2_voltage) > 1:
+            points2 = self._trace_points((weak, 2), ch2_voltage, ch2_current, rect,
+                                         x_min, x_max, y_min, y_max)
+            draw_lines(screen, color2, False, points2, line_width)
+
+    def _get_grid_surface(self, rect):
+        """Return the plot background with grid lines, rebuilt on resize or color change"""
+        if self.grid_surf is None or self.grid_surf_size != rect.size:
+            # One extra pixel so the far grid lines at rect.right/bottom are kept
+            surf = pygame.Surface((rect.width + 1, rect.height + 1))
+            surf.fill(self.BACKGROUND_COLOR)
+            surf.fill(self.GRID_BACKGROUND_COLOR, pygame.Rect(0, 0, rect.width, rect.height))
+            for i in range(11):
+                x = (i * rect.width) // 10
+                pygame.draw.line(surf, self.GRID_COLOR, (x, 0), (x, rect.height), 1)
+                y = (i * rect.height) // 10
+                pygame.draw.line(surf, self.GRID_COLOR, (0, y), (rect.width, y), 1)
+            self.grid_surf = surf
+            self.grid_surf_size = rect.size
+        return self.grid_surf
 
     def draw_dual_xy_plot(self, rect):
         """Draw I-V curves"""
-        pygame.draw.rect(self.screen, self.GRID_BACKGROUND_COLOR, rect)
-
         title_text = "I-V Characteristics - Dual DUT Comparison"
         if self.auto_scale:
             title_text += " [AUTO-SCALE]"
         else:
             title_text += f" [FIXED SCALE] Zoom:{self.zoom_level:.2f}x"
-        title = self.font.render(title_text, True, WHITE)
-        title_rect = title.get_rect(center=(rect.centerx, rect.y - 30))
-        self.screen.blit(title, title_rect)
-
-        if not self.ch1 or not self.ch2 or not self.drive_voltage or len(self.drive_voltage) < 2:
-            text = self.font.render("No Data", True, WHITE)
-            text_rect = text.get_rect(center=rect.center)
-            self.screen.blit(text, text_rect)
+        if title_text != self.title_text:
+            self.title_surf = self.font.render(title_text, True, WHITE)
+            self.title_text = title_text
+        title_rect = self.title_surf.get_rect(center=(rect.centerx, rect.y - 30))
+        self.screen.blit(self.title_surf, title_rect)
+
+        if len(self.ch1) == 0 or len(self.ch2) == 0 or len(self.drive_voltage) < 2:
+            self.screen.fill(self.GRID_BACKGROUND_COLOR, rect)
+            text_rect = self.no_data_surf.get_rect(center=rect.center)
+            self.screen.blit(self.no_data_surf, text_rect)
             pygame.draw.rect(self.screen, self.BORDER_COLOR, rect, 2)
             return
 
+        # Background and grid are static for a given plot size, so blit them pre-drawn
+        self.screen.blit(self._get_grid_surface(rect), rect.topleft)
+
         # Calculate scale
         if self.auto_scale:
             if self.excitation_mode == 2 and len(self.ch1_std) > 0 and len(self.ch1_weak) > 0:
-                x1_data_std = np.array(self.ch1_voltage_std)
-                x2_data_std = np.array(self.ch2_voltage_std)
-                y1_data_std = np.array(self.ch1_std)
-                y2_data_std = np.array(self.ch2_std)
-
-                x1_data_weak = np.array(self.ch1_voltage_weak)
-                x2_data_weak = np.array(self.ch2_voltage_weak)
-                y1_data_weak = np.array(self.ch1_weak)
-                y2_data_weak = np.array(self.ch2_weak)
-
-                x_min = min(x1_data_std.min(), x2_data_std.min(), x1_data_weak.min(), x2_data_weak.min())
-                x_max = max(x1_data_std.max(), x2_data_std.max(), x1_data_weak.max(), x2_data_weak.max())
-                y_min = min(y1_data_std.min(), y2_data_std.min(), y1_data_weak.min(), y2_data_weak.min())
-                y_max = max(y1_data_std.max(), y2_data_std.max(), y1_data_weak.max(), y2_data_weak.max())
+                x_min = min(self.range_std[0], self.range_weak[0])
+                x_max = max(self.range_std[1], self.range_weak[1])
+                y_min = min(self.range_std[2], self.range_weak[2])
+                y_max = max(self.range_std[3], self.range_weak[3])
             else:
-                x1_data = np.array(self.ch1_voltage)
-                x2_data = np.array(self.ch2_voltage)
-                y1_data = np.array(self.ch1)
-                y2_data = np.array(self.ch2)
-
-                x_min = min(x1_data.min(), x2_data.min())
-                x_max = max(x1_data.max(), x2_data.max())
-                y_min = min(y1_data.min(), y2_data.min())
-                y_max = max(y1_data.max(), y2_data.max())
+                x_min, x_max, y_min, y_max = self.data_range
 
             x_margin = (x_max - x_min) * 0.1 if x_max > x_min else 100
             x_min -= x_margin
@@ -1291,13 +1737,6 @@ class CurveTracerDual:
             y_min = y_center - y_range_visible / 2
             y_max = y_center + y_range_visible / 2
 
-        # Grid
-        for i in range(11):
-            x = rect.x + (i * rect.width) // 10
-            pygame.draw.line(self.screen, self.GRID_COLOR, (x, rect.y), (x, rect.bottom), 1)
-            y = rect.y + (i * rect.height) // 10
-            pygame.draw.line(self.screen, self.GRID_COLOR, (rect.x, y), (rect.right, y), 1)
-
         # Crosshairs
         zero_x_norm = (ADC_ORIGIN - x_min) / (x_max - x_min) if x_max != x_min else 0.5
         zero_y_norm = (0 - y_min) / (y_max - y_min) if y_max != y_min else 0.5
@@ -1310,7 +1749,9 @@ class CurveTracerDual:
             zero_y_pos = int(rect.top + (zero_y_norm * rect.height))
             pygame.draw.line(self.screen, self.CROSSHAIR_COLOR, (rect.x, zero_y_pos), (rect.right, zero_y_pos), 2)
 
-        # Draw traces
+        # Draw traces, clipped to the plot (including its far edge) so zoomed or
+        # panned curves leave the view instead of running along the border
+        self.screen.set_clip(pygame.Rect(rect.x, rect.y, rect.width + 1, rect.height + 1))
         if self.excitation_mode == 2 and len(self.ch1_std) > 0 and len(self.ch1_weak) > 0:
             if self.last_mode_was_weak:
                 self.draw_trace(self.ch1_voltage_std, self.ch2_voltage_std,
@@ -1320,12 +1761,12 @@ class CurveTracerDual:
                 self.draw_trace(self.ch1_voltage_weak, self.ch2_voltage_weak,
                                 self.ch1_weak, self.ch2_weak,
                                 self.DUT1_COLOR, self.DUT2_COLOR,
-                                rect, x_min, x_max, y_min, y_max, line_width=3)
+                                rect, x_min, x_max, y_min, y_max, line_width=3, weak=True)
             else:
                 self.draw_trace(self.ch1_voltage_weak, self.ch2_voltage_weak,
                                 self.ch1_weak, self.ch2_weak,
                                 self.DUT1_DIMMED, self.DUT2_DIMMED,
-                                rect, x_min, x_max, y_min, y_max, line_width=2)
+                                rect, x_min, x_max, y_min, y_max, line_width=2, weak=True)
                 self.draw_trace(self.ch1_voltage_std, self.ch2_voltage_std,
                                 self.ch1_std, self.ch2_std,
                                 self.DUT1_COLOR, self.DUT2_COLOR,
@@ -1334,30 +1775,32 @@ class CurveTracerDual:
             self.draw_trace(self.ch1_voltage, self.ch2_voltage,
                             self.ch1, self.ch2,
                             self.DUT1_COLOR, self.DUT2_COLOR,
-                            rect, x_min, x_max, y_min, y_max, line_width=3)
-
-        # Axis labels
-        for i in [0, 5, 10]:
-            x_val = x_min + (x_max - x_min) * (10 - i) / 10
+                            rect, x_min, x_max, y_min, y_max, line_width=3,
+                            weak=self.last_mode_was_weak)
+        self.screen.set_clip(None)
+
+        # Axis labels, re-rendered only when the displayed values change
+        tick_values = tuple(int(x_min + (x_max - x_min) * (10 - i) / 10) for i in (0, 5, 10)) + \
+            tuple(int(y_min + (y_max - y_min) * i / 10) for i in (0, 5, 10))
+        if tick_values != self.tick_label_values:
+            self.tick_label_surfs = [self.small_font.render(f"{value}", True, self.LABEL_COLOR)
+                                     for value in tick_values]
+            self.tick_label_values = tick_values
+
+        for n, i in enumerate((0, 5, 10)):
             x_pos = rect.x + (i * rect.width) // 10
-            label = self.small_font.render(f"{int(x_val)}", True, self.LABEL_COLOR)
-            label_rect = label.get_rect(center=(x_pos, rect.bottom + 25))
-            self.screen.blit(label, label_rect)
+            label = self.tick_label_surfs[n]
+            self.screen.blit(label, label.get_rect(center=(x_pos, rect.bottom + 25)))
 
-        for i in [0, 5, 10]:
-            y_val = y_min + (y_max - y_min) * i / 10
             y_pos = rect.y + (i * rect.height) // 10
-            label = self.small_font.render(f"{int(y_val)}", True, self.LABEL_COLOR)
-            label_rect = label.get_rect(midright=(rect.x - 10, y_pos))
-            self.screen.blit(label, label_rect)
+            label = self.tick_label_surfs[n + 3]
+            self.screen.blit(label, label.get_rect(midright=(rect.x - 10, y_pos)))
 
         # Axis titles
-        x_title = self.font.render("DUT Voltage", True, self.AXIS_TITLE_COLOR)
-        x_title_rect = x_title.get_rect(center=(rect.centerx, rect.bottom + 50))
-        self.screen.blit(x_title, x_title_rect)
+        x_title_rect = self.x_title_surf.get_rect(center=(rect.centerx, rect.bottom + 50))
+        self.screen.blit(self.x_title_surf, x_title_rect)
 
-        y_title = self.font.render("Current", True, self.AXIS_TITLE_COLOR)
-        self.screen.blit(y_title, (rect.x - 80, rect.centery - 30))
+        self.screen.blit(self.y_title_surf, (rect.x - 80, rect.centery - 30))
 
         # Legend
         legend_x = rect.x + 20
@@ -1365,46 +1808,36 @@ class CurveTracerDual:
 
         pygame.draw.line(self.screen, self.DUT1_COLOR,
                          (legend_x, legend_y), (legend_x + 40, legend_y), 4)
-        dut1_text = self.font.render("DUT1 (CH1 - Black Lead)", True, self.DUT1_COLOR)
-        self.screen.blit(dut1_text, (legend_x + 50, legend_y - 12))
+        self.screen.blit(self.dut1_legend_surf, (legend_x + 50, legend_y - 12))
 
         if not self.single_channel:
             pygame.draw.line(self.screen, self.DUT2_COLOR,
                              (legend_x, legend_y + 30), (legend_x + 40, legend_y + 30), 4)
-            dut2_text = self.font.render("DUT2 (CH2 - Red Lead)", True, self.DUT2_COLOR)
-            self.screen.blit(dut2_text, (legend_x + 50, legend_y + 18))
+            self.screen.blit(self.dut2_legend_surf, (legend_x + 50, legend_y + 18))
 
         pygame.draw.rect(self.screen, self.BORDER_COLOR, rect, 2)
 
         # Pause overlay
         if self.paused:
-            overlay_font = pygame.font.Font(None, 72)
-            pause_text = overlay_font.render("PAUSED", True, YELLOW)
-            pause_rect = pause_text.get_rect(center=rect.center)
-            s = pygame.Surface((pause_rect.width + 40, pause_rect.height + 20))
-            s.set_alpha(200)
-            s.fill(BLACK)
-            self.screen.blit(s, (pause_rect.x - 20, pause_rect.y - 10))
-            self.screen.blit(pause_text, pause_rect)
+            pause_rect = self.pause_surf.get_rect(center=rect.center)
+            self.screen.blit(self.pause_bg_surf, (pause_rect.x - 20, pause_rect.y - 10))
+            self.screen.blit(self.pause_surf, pause_rect)
 
     def draw_info_panel(self):
         """Draw info panel"""
         info_y = self.height - 60
 
-        if self.ch1 and self.ch2 and self.drive_voltage:
-            info_lines = [
-                f"CH1 (DUT1 Current - Black Lead): {min(self.ch1):.0f}-{max(self.ch1):.0f}  Mean: {int(np.mean(self.ch1))}  Points: {len(self.ch1)}",
-                f"CH2 (DUT2 Current - Red Lead): {min(self.ch2):.0f}-{max(self.ch2):.0f}  Mean: {int(np.mean(self.ch2))}  Points: {len(self.ch2)}",
-                f"DUT Voltages: V1={min(self.ch1_voltage):.0f}-{max(self.ch1_voltage):.0f}, V2={min(self.ch2_voltage):.0f}-{max(self.ch2_voltage):.0f}, Drive={min(self.drive_voltage):.0f}-{max(self.drive_voltage):.0f}"
-            ]
-            for i, line in enumerate(info_lines):
-                color = [self.DUT1_COLOR, self.DUT2_COLOR, self.DUT_VOLTAGE_COLOR][i]
-                text = self.small_font.render(line, True, color)
-                self.screen.blit(text, (20, info_y + i * 22))
+        if self.ch1_stats is not None:
+            # Statistics only change per acquisition; re-render the lines only then
+            stats_key = (self.ch1_stats, self.ch2_stats, self.ch1_voltage_stats,
+                         self.ch2_voltage_stats, self.drive_voltage_stats)
+            if stats_key != self.stats_key:
+                self.stats_surf = self._render_stats_lines()
+                self.stats_key = stats_key
+            self.screen.blit(self.stats_surf, (20, info_y))
 
         # Status
-        mode_names = ["4.7K(T)", "100K WEAK(W)", "ALT"]
-        mode_str = mode_names[self.excitation_mode]
+        mode_str = self.MODE_NAMES[self.excitation_mode]
 
         if self.excitation_mode == 2 and len(self.ch1) > 0:
             if self.last_mode_was_weak:
@@ -1415,23 +1848,62 @@ class CurveTracerDual:
         pause_str = " [PAUSED]" if self.paused else ""
         single_str = " [SINGLE CH]" if self.single_channel else ""
         scale_str = " [AUTO]" if self.auto_scale else " [FIXED]"
-        status = f"Controls: SPACE=mode P=pause S=single A=auto F=fit R=reset F1=settings | Drag=pan Wheel=zoom"
-        info = f"Frame: {self.frame_count}  |  FPS: {self.fps:.1f}  |  Mode: {mode_str}{pause_str}{single_str}{scale_str}"
-        status_text = self.small_font.render(status, True, GRAY)
-        info_text = self.small_font.render(info, True, GRAY)
-        self.screen.blit(status_text, (20, 5))
-        self.screen.blit(info_text, (20, 20))
+        # The counters change every frame, the mode flags rarely; render them apart.
+        # Whole FPS only: tenths just jitter and would force a re-render every frame
+        info = f"Frame: {self.frame_count}  |  FPS: {int(self.fps)}  |  "
+        if info != self.info_text:
+            self.info_surf = self.small_font.render(info, True, GRAY)
+            self.info_text = info
+        status = f"Mode: {mode_str}{pause_str}{single_str}{scale_str}"
+        if status != self.status_text:
+            self.status_surf = self.small_font.render(status, True, GRAY)
+            self.status_text = status
+        self.screen.blit(self.controls_surf, (20, 5))
+        self.screen.blit(self.info_surf, (20, 20))
+        self.screen.blit(self.status_surf, (20 + self.info_surf.get_width(), 20))
 
         # Show connection status
-        conn_status = "Connected" if (self.serial and self.serial.is_open) else "NOT CONNECTED"
-        conn_color = GREEN if (self.serial and self.serial.is_open) else RED
-        conn_text = self.small_font.render(f"Serial: {conn_status}", True, conn_color)
+        connected = bool(self.serial and self.serial.is_open)
+        conn_text = self.conn_surfs.get(connected)
+        if conn_text is None:
+            conn_status = "Connected" if connected else "NOT CONNECTED"
+            conn_color = GREEN if connected else RED
+            conn_text = self.small_font.render(f"Serial: {conn_status}", True, conn_color)
+            self.conn_surfs[connected] = conn_text
         self.screen.blit(conn_text, (self.width - 200, 5))
 
+    def _render_stats_lines(self):
+        """Render the three channel statistics lines of the info panel"""
+        ch1_min, ch1_max, ch1_mean = self.ch1_stats
+        ch2_min, ch2_max, ch2_mean = self.ch2_stats
+        v1_min, v1_max = self.ch1_voltage_stats
+        v2_min, v2_max = self.ch2_voltage_stats
+        drive_min, drive_max = self.drive_voltage_stats
+        info_lines = [
+            f"CH1 (DUT1 Current - Black Lead): {ch1_min:.0f}-{ch1_max:.0f}  Mean: {int(ch1_mean)}  Points: {len(self.ch1)}",
+            f"CH2 (DUT2 Current - Red Lead): {ch2_min:.0f}-{ch2_max:.0f}  Mean: {int(ch2_mean)}  Points: {len(self.ch2)}",
+            f"DUT Voltages: V1={v1_min:.0f}-{v1_max:.0f}, V2={v2_min:.0f}-{v2_max:.0f}, Drive={drive_min:.0f}-{drive_max:.0f}"
+        ]
+        colors = (self.DUT1_COLOR, self.DUT2_COLOR, self.DUT_VOLTAGE_COLOR)
+        lines = [self.small_font.render(line, True, color) for line, color in zip(info_lines, colors)]
+
+        # Composite onto one transparent surface so a redraw is a single blit
+        surf = pygame.Surface((max(line.get_width() for line in lines),
+                               (len(lines) - 1) * 22 + lines[-1].get_height()), pygame.SRCALPHA)
+        for i, line in enumerate(lines):
+            surf.blit(line, (0, i * 22))
+        return surf
+
+    def clear_around(self, rect):
+        """Fill the background outside rect; the plot repaints its own area"""
+        self.screen.fill(self.BACKGROUND_COLOR, (0, 0, self.width, rect.top))
+        self.screen.fill(self.BACKGROUND_COLOR, (0, rect.bottom, self.width, self.height - rect.bottom))
+        self.screen.fill(self.BACKGROUND_COLOR, (0, rect.top, rect.left, rect.height))
+        self.screen.fill(self.BACKGROUND_COLOR, (rect.right, rect.top, self.width - rect.right, rect.height))
+
     def run(self):
         """Main loop"""
         running = True
-        last_update = time.time()
 
         debug_print("\n" + "=" * 70)
         debug_print("Curve Tracer - Dual DUT Comparison")
@@ -1448,10 +1920,20 @@ class CurveTracerDual:
         debug_print("\nMouse: Drag=pan, Wheel=zoom")
         debug_print("=" * 70 + "\n")
 
+        redraw = True
         while running:
-            dt = self.clock.tick(20) / 1000.0
+            if self.paused and not redraw and not self.settings_window.active:
+                # Nothing to acquire or animate: sleep in SDL until input arrives
+                event = pygame.event.wait(100)
+                events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+                dt = self.clock.tick() / 1000.0
+            else:
+                dt = self.clock.tick(20) / 1000.0
+                events = pygame.event.get()
+
+            for event in events:
+                redraw = True
 
-            for event in pygame.event.get():
                 # Handle window resize
                 if event.type == pygame.VIDEORESIZE:
                     self.handle_resize(event.w, event.h)
@@ -1460,6 +1942,7 @@ class CurveTracerDual:
                 # Settings window gets priority
                 if self.settings_window.handle_event(event):
                     self._load_colors()
+                    self._load_keymap()
                     continue
 
                 # Settings button (only if settings not active)
@@ -1476,28 +1959,28 @@ class CurveTracerDual:
                     running = False
 
                 elif event.type == pygame.KEYDOWN:
-                    if event.key in [self.get_key_from_config('quit'), pygame.K_ESCAPE]:
+                    action = self.action_by_key.get(event.key)
+                    if action == 'quit':
                         running = False
-                    elif event.key == self.get_key_from_config('cycle_mode'):
+                    elif action == 'cycle_mode':
                         self.excitation_mode = (self.excitation_mode + 1) % 3
-                        mode_names = ["4.7K Ohm (T)", "100K Ohm WEAK (W)", "Alternating (T+W)"]
-                        debug_print(f"Excitation mode: {mode_names[self.excitation_mode]}")
-                    elif event.key == self.get_key_from_config('pause'):
+                        debug_print(f"Excitation mode: {self.MODE_DESCRIPTIONS[self.excitation_mode]}")
+                    elif action == 'pause':
                         self.paused = not self.paused
                         debug_print(f"Paused: {self.paused}")
-                    elif event.key == self.get_key_from_config('single_channel'):
+                    elif action == 'single_channel':
                         self.single_channel = not self.single_channel
                         debug_print(f"Single channel: {self.single_channel}")
-                    elif event.key == self.get_key_from_config('auto_scale'):
+                    elif action == 'auto_scale':
                         self.auto_scale = not self.auto_scale
                         debug_print(f"Auto scale: {self.auto_scale}")
-                    elif event.key == self.get_key_from_config('fit_window'):
+                    elif action == 'fit_window':
                         if not self.auto_scale:
                             self.fit_to_window()
-                    elif event.key == self.get_key_from_config('reset_view'):
+                    elif action == 'reset_view':
                         if not self.auto_scale:
                             self.reset_view()
-                    elif event.key == self.get_key_from_config('settings'):
+                    elif action == 'settings':
                         self.settings_window.show()
 
                 elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -1533,23 +2016,25 @@ class CurveTracerDual:
                         self.pan_offset_x = self.drag_start_offset[0] - x_offset_change
                         self.pan_offset_y = self.drag_start_offset[1] + y_offset_change
 
-            # Update settings window
+            # Update settings window; a blinking cursor only needs a redraw when it toggles
             self.settings_window.update(dt)
+            if self.settings_window.active and self.settings_window.dirty:
+                redraw = True
 
             # Acquire data
             if not self.paused and not self.settings_window.active and self.acquire():
                 self.frame_count += 1
+                redraw = True
 
-            # Calculate FPS
-            current_time = time.time()
-            if current_time - last_update > 0:
-                self.fps = 1.0 / (current_time - last_update)
-            last_update = current_time
+            # Smoothed FPS from the loop period clock.tick() already measured
+            if dt > 0:
+                self.fps = 1.0 / dt if self.fps == 0 else 0.9 * self.fps + 0.1 / dt
 
-            # Draw
-            self.screen.fill(self.BACKGROUND_COLOR)
+            # Screen still shows the last frame when no data or input arrived
+            if not redraw:
+                continue
 
-            # Only draw main UI if settings is not active
+            # Draw (the settings window clears the full screen itself)
             if not self.settings_window.active:
                 # Calculate plot area dynamically based on window size
                 margin = min(150, self.width // 10)
@@ -1559,6 +2044,7 @@ class CurveTracerDual:
                     self.width - margin - 50,
                     self.height - 200
                 )
+                self.clear_around(plot_rect)
                 self.draw_dual_xy_plot(plot_rect)
                 self.draw_info_panel()
                 self.settings_button.draw(self.screen)
@@ -1567,6 +2053,8 @@ class CurveTracerDual:
             self.settings_window.draw(self.screen)
 
             pygame.display.flip()
+            # Cleared only once a frame is shown, so the initial redraw can't be lost
+            redraw = False
 
         if self.serial:
             self.serial.close()
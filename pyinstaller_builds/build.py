@@ -9,7 +9,17 @@ import sys
 import platform
 import subprocess
 import shutil
+import string
+import time
+import gzip
 import argparse
+import contextlib
+import tarfile
+import zipfile
+import hashlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import distribution, version, PackageNotFoundError
 from pathlib import Path
 
 
@@ -28,6 +38,55 @@ class BuildConfig:
     BUILD_DIR = "build"
     DIST_DIR = "dist"
 
+    # Required packages (import name: pip name)
+    REQUIRED_PACKAGES = {
+        'pygame': 'pygame',
+        'serial': 'pyserial',
+        'numpy': 'numpy',
+        'PyInstaller': 'pyinstaller'
+    }
+
+    # Always-listed hidden imports
+    HIDDEN_IMPORTS = [
+        'pygame',
+        'serial',
+        'serial.tools',
+        'serial.tools.list_ports',
+        'numpy',
+        'numpy.core',
+        'numpy.core._multiarray_umath',
+    ]
+
+    # PyInstaller's config/cache dir (UPX-packed and stripped binaries, bootloaders).
+    # CI persists it between runs; override the location with PYCURVEBUG_PYI_CACHE.
+    PYINSTALLER_CACHE = os.environ.get('PYCURVEBUG_PYI_CACHE',
+                                       os.path.join(Path.home(), '.pyinstaller-pycurvebug'))
+
+    # Modules never used at runtime, left out of the bundle. numba is an
+    # optional extra for running from source; frozen builds use the NumPy path.
+    # numpy only imports numpy.testing, unittest and pydoc lazily (np.test(),
+    # np.info()), which PyCurveBug never calls.
+    EXCLUDES = [
+        'numba',
+        'llvmlite',
+        'numpy.distutils',
+        'numpy.f2py',
+        'numpy.testing',
+        'numpy.tests',
+        'pygame.tests',
+        'pygame.examples',
+        'pygame.docs',
+        'tkinter',
+        'unittest',
+        'pydoc',
+        'pdb',
+        'doctest',
+        'xmlrpc',
+        'test',
+        'matplotlib',
+        'PIL',
+    ]
+
     # Platform-specific settings
     PLATFORM_SETTINGS = {
         'Windows': {
@@ -35,12 +94,24 @@ class BuildConfig:
             'extension': '.exe',
             'separator': ';',
             'console': False,
+            # pyserial picks its port backend and port lister at runtime
+            'hidden_imports': [
+                'serial.serialwin32',
+                'serial.tools.list_ports_common',
+                'serial.tools.list_ports_windows',
+            ],
         },
         'Linux': {
             'icon': 'icon.png',
             'extension': '',
             'separator': ':',
             'console': False,
+            'hidden_imports': [
+                'serial.serialposix',
+                'serial.tools.list_ports_common',
+                'serial.tools.list_ports_posix',
+                'serial.tools.list_ports_linux',
+            ],
         },
         'Darwin': {  # macOS
             'icon': 'icon.icns',
@@ -48,124 +119,38 @@ class BuildConfig:
             'separator': ':',
             'console': False,
             'bundle_identifier': 'com.communityTEK.pycurvebug',
+            'hidden_imports': [
+                'serial.serialposix',
+                'serial.tools.list_ports_common',
+                'serial.tools.list_ports_posix',
+                'serial.tools.list_ports_osx',
+            ],
         }
     }
 
 
-def get_platform():
-    """Detect the current platform"""
-    system = platform.system()
-    if system == 'Windows':
-        return 'Windows'
-    elif system == 'Linux':
-        return 'Linux'
-    elif system == 'Darwin':
-        return 'Darwin'
-    else:
-        raise RuntimeError(f"Unsupported platform: {system}")
-
-
-def clean_build_dirs():
-    """Remove previous build artifacts"""
-    dirs_to_clean = [BuildConfig.BUILD_DIR, BuildConfig.DIST_DIR, '__pycache__']
-    for dir_name in dirs_to_clean:
-        if os.path.exists(dir_name):
-            print(f"Cleaning {dir_name}...")
-            shutil.rmtree(dir_name)
-
-    # Remove spec file if it exists
-    spec_file = f"{BuildConfig.APP_NAME}.spec"
-    if os.path.exists(spec_file):
-        os.remove(spec_file)
-        print(f"Removed {spec_file}")
-
-
-def check_dependencies():
-    """Check if required packages are installed"""
-    required_imports = {
-        'pygame': 'pygame',
-        'serial': 'pyserial',
-        'numpy': 'numpy',
-        'PyInstaller': 'pyinstaller'
-    }
-
-    missing_packages = []
-
-    for import_name, package_name in required_imports.items():
-        try:
-            __import__(import_name)
-            print(f"  YES - {package_name} ({import_name})")
-        except ImportError:
-            missing_packages.append(package_name)
-            print(f"  NO - {package_name} ({import_name})")
-
-    if missing_packages:
-        print("\nError: Missing required packages:")
-        for package in missing_packages:
-            print(f"  - {package}")
-        print("\nInstall them using:")
-        print(f"  pip install {' '.join(missing_packages)}")
-        return False
-
-    return True
-
-
-def find_icon(platform_name, custom_icon=None):
-    """Find and validate icon file"""
-    if custom_icon:
-        if os.path.exists(custom_icon):
-            print(f"  Yes, using custom icon: {custom_icon}")
-            return custom_icon
-        else:
-            print(f"  No custom icon not found: {custom_icon}")
-
-    # Try default icon for platform
-    default_icon = BuildConfig.PLATFORM_SETTINGS[platform_name]['icon']
-    if os.path.exists(default_icon):
-        print(f"  Using default icon: {default_icon}")
-        return default_icon
-
-    print(f"  No icon file found (optional)")
-    print(f"    Expected: {default_icon}")
-    if platform_name == 'Windows':
-        print("    Tip: Create an .ico file or use online converter")
-    elif platform_name == 'Darwin':
-        print("    Tip: Create an .icns file using 'iconutil' on macOS")
-
-    return None
-
-
-def create_spec_file(platform_name, icon_path=None):
-    """Create a .spec file for PyInstaller"""
-    settings = BuildConfig.PLATFORM_SETTINGS[platform_name]
-
-    # Format icon path for spec file
-    icon_line = f"icon='{icon_path}'" if icon_path else "icon=None"
-
-    spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
+# Spec file text. The script and data paths only depend on BuildConfig, so they
+# are filled in once here; hidden imports and the EXE parts are filled in per build.
+SPEC_HEADER_TEMPLATE = string.Template(string.Template('''# -*- mode: python ; coding: utf-8 -*-
 
 block_cipher = None
 
 a = Analysis(
-    ['{BuildConfig.MAIN_SCRIPT}'],
+    ['$main_script'],
     pathex=[],
     binaries=[],
     datas=[
-        ('{BuildConfig.CONFIG_FILE}', '.'),
+        ('$config_file', '.'),
     ],
     hiddenimports=[
-        'pygame',
-        'serial',
-        'serial.tools',
-        'serial.tools.list_ports',
-        'numpy',
-        'numpy.core',
-        'numpy.core._multiarray_umath',
+$hidden_imports
     ],
     hookspath=[],
-    hooksconfig={{}},
+    hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+$excludes
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -173,27 +158,30 @@ a = Analysis(
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-'''
-
-    # Platform-specific EXE configuration
-    if platform_name == 'Darwin':  # macOS
-        spec_content += f'''
+''').safe_substitute(
+    main_script=BuildConfig.MAIN_SCRIPT,
+    config_file=BuildConfig.CONFIG_FILE,
+    excludes='\n'.join(f"        '{module}'," for module in BuildConfig.EXCLUDES),
+))
+
+# macOS
+SPEC_DARWIN_TEMPLATE = string.Template(string.Template('''
 exe = EXE(
     pyz,
     a.scripts,
     [],
     exclude_binaries=True,
-    name='{BuildConfig.APP_NAME}',
+    name='$name',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    console={settings['console']},
+    upx=$upx,
+    console=$console,
     disable_windowed_traceback=False,
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
-    {icon_line},
+    $icon_line,
 )
 
 coll = COLLECT(
@@ -202,21 +190,22 @@ coll = COLLECT(
     a.zipfiles,
     a.datas,
     strip=False,
-    upx=True,
+    upx=$upx,
     upx_exclude=[],
-    name='{BuildConfig.APP_NAME}',
+    name='$name',
 )
 
 app = BUNDLE(
     coll,
-    name='{BuildConfig.APP_NAME}.app',
-    {icon_line},
-    bundle_identifier='{settings.get('bundle_identifier', 'com.example.pycurvebug')}',
-    version='{BuildConfig.VERSION}',
+    name='$name.app',
+    $icon_line,
+    bundle_identifier='$bundle_identifier',
+    version='$version',
 )
-'''
-    else:  # Windows and Linux
-        spec_content += f'''
+''').safe_substitute(version=BuildConfig.VERSION))
+
+# Windows and Linux
+SPEC_DEFAULT_TEMPLATE = string.Template('''
 exe = EXE(
     pyz,
     a.scripts,
@@ -224,82 +213,30 @@ exe = EXE(
     a.zipfiles,
     a.datas,
     [],
-    name='{BuildConfig.APP_NAME}',
+    name='$name',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=$upx,
     upx_exclude=[],
     runtime_tmpdir=None,
-    console={settings['console']},
+    console=$console,
     disable_windowed_traceback=False,
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
-    {icon_line},
+    $icon_line,
 )
-'''
-
-    spec_file = f"{BuildConfig.APP_NAME}.spec"
-    with open(spec_file, 'w') as f:
-        f.write(spec_content)
-
-    print(f"Created {spec_file}")
-    return spec_file
-
-
-def build_executable(spec_file):
-    """Build the executable using PyInstaller"""
-    print(f"\nBuilding {BuildConfig.APP_NAME}...")
-    print("This may take a few minutes...\n")
-
-    cmd = [
-        'pyinstaller',
-        '--clean',
-        '--noconfirm',
-        spec_file
-    ]
-
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        print("Build failed!")
-        print(e.stdout)
-        print(e.stderr)
-        return False
-
-
-def create_distribution_package(platform_name):
-    """Create a distribution package"""
-    settings = BuildConfig.PLATFORM_SETTINGS[platform_name]
-
-    # Create distribution directory
-    dist_name = f"{BuildConfig.APP_NAME}-{BuildConfig.VERSION}-{platform_name}"
-    dist_path = Path(BuildConfig.DIST_DIR) / dist_name
+''')
 
-    if dist_path.exists():
-        shutil.rmtree(dist_path)
-    dist_path.mkdir(parents=True)
 
-    # Copy executable
-    if platform_name == 'Darwin':
-        src = Path(BuildConfig.DIST_DIR) / f"{BuildConfig.APP_NAME}.app"
-        if src.exists():
-            shutil.copytree(src, dist_path / f"{BuildConfig.APP_NAME}.app")
-    else:
-        exe_name = f"{BuildConfig.APP_NAME}{settings['extension']}"
-        src = Path(BuildConfig.DIST_DIR) / exe_name
-        if src.exists():
-            shutil.copy2(src, dist_path / exe_name)
+# Host details, looked up once
+HOST_SYSTEM = platform.system()
+HOST_PLATFORM = platform.platform()
 
-    # Copy config file
-    if os.path.exists(BuildConfig.CONFIG_FILE):
-        shutil.copy2(BuildConfig.CONFIG_FILE, dist_path / BuildConfig.CONFIG_FILE)
 
-    # Create README
-    readme_content = f"""# {BuildConfig.APP_NAME} v{BuildConfig.VERSION}
+# Distribution README; everything but the target platform is known up front
+README_TEMPLATE = string.Template(string.Template('''# $app_name v$version
 
 ## Installation
 
@@ -307,7 +244,7 @@ Simply extract this archive and run the executable.
 
 ## Configuration
 
-The application uses `{BuildConfig.CONFIG_FILE}` for configuration.
+The application uses `$config_file` for configuration.
 You can modify this file to change:
 - Serial port settings
 - Window size
@@ -317,7 +254,7 @@ You can modify this file to change:
 ## Usage
 
 1. Connect your vintageTEK CurveBug device
-2. Run {BuildConfig.APP_NAME}
+2. Run $app_name
 3. Press F1 to open settings if needed
 4. Use keyboard shortcuts for control:
    - SPACE: Cycle excitation mode
@@ -329,14 +266,280 @@ You can modify this file to change:
    - F1: Settings
    - Q/ESC: Quit
 
-## Platform: {platform_name}
+## Platform: $platform_name
+''').safe_substitute(
+    app_name=BuildConfig.APP_NAME,
+    version=BuildConfig.VERSION,
+    config_file=BuildConfig.CONFIG_FILE,
+))
 
-Built on: {platform.platform()}
+# Host details, only packaged on request since they change from build to build
+BUILD_INFO = f"""Built on: {HOST_PLATFORM}
 Python version: {sys.version}
 """
 
-    with open(dist_path / "README.txt", 'w') as f:
-        f.write(readme_content)
+# Earliest timestamp a zip entry can hold (1980-01-01)
+ZIP_EPOCH = 315532800
+
+
+def source_date_epoch():
+    """Timestamp for archive entries: $SOURCE_DATE_EPOCH, else the last commit time"""
+    try:
+        return int(os.environ['SOURCE_DATE_EPOCH'])
+    except (KeyError, ValueError):
+        pass
+    try:
+        result = subprocess.run(['git', 'log', '-1', '--format=%ct'],
+                                capture_output=True, text=True, check=True)
+        return int(result.stdout)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return ZIP_EPOCH
+
+
+def usable_cpus():
+    """Number of CPUs this process may run on"""
+    # The affinity mask honours taskset/cpuset limits on shared runners; os.cpu_count() doesn't
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def get_platform():
+    """Detect the current platform"""
+    if HOST_SYSTEM not in BuildConfig.PLATFORM_SETTINGS:
+        raise RuntimeError(f"Unsupported platform: {HOST_SYSTEM}")
+    return HOST_SYSTEM
+
+
+def remove_tree(path):
+    """Remove a directory tree, deleting its top-level entries in parallel"""
+    # PyInstaller's build/ holds many thousands of small files; unlink blocks in
+    # the kernel without the GIL, so threads keep several deletions in flight
+    def remove(entry):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+    with os.scandir(path) as entries, ThreadPoolExecutor(max_workers=8) as executor:
+        # list() re-raises the first error from any worker
+        list(executor.map(remove, entries))
+    os.rmdir(path)
+
+
+def clean_build_dirs():
+    """Remove previous build artifacts"""
+    dirs_to_clean = [BuildConfig.BUILD_DIR, BuildConfig.DIST_DIR, '__pycache__']
+    for dir_name in dirs_to_clean:
+        try:
+            remove_tree(dir_name)
+            print(f"Cleaned {dir_name}")
+        except FileNotFoundError:
+            pass
+
+    # Remove spec files, including per-variant ones
+    for spec_file in Path('.').glob(f"{BuildConfig.APP_NAME}*.spec"):
+        spec_file.unlink()
+        print(f"Removed {spec_file}")
+
+
+def check_dependencies():
+    """Check if required packages are installed"""
+    missing_packages = []
+
+    # Only ask whether each distribution is installed; importing pygame/numpy
+    # just to check would initialize them (and print pygame's banner)
+    for import_name, package_name in BuildConfig.REQUIRED_PACKAGES.items():
+        try:
+            distribution(package_name)
+            print(f"  YES - {package_name} ({import_name})")
+        except PackageNotFoundError:
+            missing_packages.append(package_name)
+            print(f"  NO - {package_name} ({import_name})")
+
+    if missing_packages:
+        print("\nError: Missing required packages:")
+        for package in missing_packages:
+            print(f"  - {package}")
+        print("\nInstall them using:")
+        print(f"  pip install {' '.join(missing_packages)}")
+        return False
+
+    return True
+
+
+def find_icon(platform_name, custom_icon=None):
+    """Find and validate icon file"""
+    if custom_icon:
+        if os.path.exists(custom_icon):
+            print(f"  Yes, using custom icon: {custom_icon}")
+            return custom_icon
+        else:
+            print(f"  No custom icon not found: {custom_icon}")
+
+    # Try default icon for platform
+    default_icon = BuildConfig.PLATFORM_SETTINGS[platform_name]['icon']
+    if os.path.exists(default_icon):
+        print(f"  Using default icon: {default_icon}")
+        return default_icon
+
+    print(f"  No icon file found (optional)")
+    print(f"    Expected: {default_icon}")
+    if platform_name == 'Windows':
+        print("    Tip: Create an .ico file or use online converter")
+    elif platform_name == 'Darwin':
+        print("    Tip: Create an .icns file using 'iconutil' on macOS")
+
+    return None
+
+
+def create_spec_file(platform_name, icon_path=None, name=BuildConfig.APP_NAME, console=None, upx=False):
+    """Create a .spec file for PyInstaller"""
+    settings = BuildConfig.PLATFORM_SETTINGS[platform_name]
+    if console is None:
+        console = settings['console']
+
+    # Format icon path for spec file
+    icon_line = f"icon='{icon_path}'" if icon_path else "icon=None"
+
+    # Platform-specific EXE configuration
+    exe_template = SPEC_DARWIN_TEMPLATE if platform_name == 'Darwin' else SPEC_DEFAULT_TEMPLATE
+    hidden_imports = '\n'.join(f"        '{module}'," for module in BuildConfig.HIDDEN_IMPORTS + settings['hidden_imports'])
+    spec_content = SPEC_HEADER_TEMPLATE.substitute(hidden_imports=hidden_imports) + exe_template.substitute(
+        name=name,
+        console=console,
+        upx=upx,
+        icon_line=icon_line,
+        bundle_identifier=settings.get('bundle_identifier', 'com.example.pycurvebug'),
+    )
+
+    spec_file = f"{name}.spec"
+
+    # Leave an identical spec untouched so its mtime doesn't invalidate PyInstaller's cache
+    try:
+        with open(spec_file) as f:
+            if f.read() == spec_content:
+                print(f"{spec_file} is up to date")
+                return spec_file
+    except FileNotFoundError:
+        pass
+
+    # Write beside it and swap in, so a concurrent build never reads a partial spec
+    tmp_file = f"{spec_file}.tmp"
+    with open(tmp_file, 'w') as f:
+        f.write(spec_content)
+    os.replace(tmp_file, spec_file)
+
+    print(f"Created {spec_file}")
+    return spec_file
+
+
+def dependency_workpath():
+    """PyInstaller work directory for the installed dependency versions"""
+    # Each set of dependency versions keeps its own analysis and archive cache,
+    # so upgrading (or switching back) never reuses another environment's
+    versions = '\n'.join(f"{package}=={version(package)}" for package in BuildConfig.REQUIRED_PACKAGES.values())
+    digest = hashlib.sha256(versions.encode()).hexdigest()[:12]
+    return os.path.join(BuildConfig.BUILD_DIR, f"deps-{digest}")
+
+
+def build_executable(spec_file, fresh=False, config_dir=BuildConfig.PYINSTALLER_CACHE, prefix='', upx_dir=None):
+    """Build the executable using PyInstaller, echoing its log as it runs"""
+    print(f"\nBuilding {Path(spec_file).stem}...")
+    print("This may take a few minutes...\n")
+
+    cmd = ['pyinstaller', '--noconfirm', '--workpath', dependency_workpath(), spec_file]
+
+    # Keep PyInstaller's analysis cache between runs unless a fresh build is requested
+    if fresh:
+        cmd.insert(1, '--clean')
+    if upx_dir:
+        cmd[1:1] = ['--upx-dir', upx_dir]
+
+    # PyInstaller compiles the bytecode it bundles itself; don't also leave
+    # __pycache__ dirs behind from the modules it imports while analysing
+    env = {**os.environ, 'PYINSTALLER_CONFIG_DIR': config_dir, 'PYTHONDONTWRITEBYTECODE': '1'}
+
+    # Stream the log instead of buffering all of it; keep only the tail for errors
+    tail = deque(maxlen=200)
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1, env=env) as proc:
+        for line in proc.stdout:
+            tail.append(line)
+            print(f"{prefix}{line}", end='')
+
+    if proc.returncode != 0:
+        print(f"{prefix}Build failed! Last {len(tail)} lines of output:")
+        print(''.join(tail))
+        return False
+    return True
+
+
+def build_variants(variants, fresh=False, upx_dir=None):
+    """Build several spec files at once; returns True only if every build succeeded"""
+    # PyInstaller does its work in the child process, so threads are enough to
+    # run the builds side by side. Each variant keeps its own PyInstaller cache
+    # dir so concurrent jobs can't corrupt a shared one.
+    def build(variant):
+        name, spec_file = variant
+        config_dir = os.path.join(BuildConfig.PYINSTALLER_CACHE, name)
+        return build_executable(spec_file, fresh, config_dir, f"[{name}] ", upx_dir)
+
+    with ThreadPoolExecutor(max_workers=min(len(variants), usable_cpus())) as executor:
+        results = list(executor.map(build, variants))
+    return all(results)
+
+
+def link_or_copy(src, dst):
+    """Hard-link src to dst, copying instead where the filesystem can't link"""
+    try:
+        os.link(src, dst)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        # shutil.copy keeps the permission bits (the executable flag)
+        shutil.copy(src, dst)
+
+
+def create_distribution_package(platform_name, name=BuildConfig.APP_NAME, compress_level=1, build_info=False):
+    """Create a distribution package"""
+    settings = BuildConfig.PLATFORM_SETTINGS[platform_name]
+
+    # Create distribution directory
+    dist_name = f"{name}-{BuildConfig.VERSION}-{platform_name}"
+    dist_path = Path(BuildConfig.DIST_DIR) / dist_name
+
+    # Missing sources are skipped; trying and catching saves a stat per path
+    try:
+        shutil.rmtree(dist_path)
+    except FileNotFoundError:
+        pass
+    dist_path.mkdir(parents=True)
+
+    # Link the executable (or the whole .app bundle) in beside the other files;
+    # it lives on the same disk under dist/, so no bytes need copying
+    try:
+        if platform_name == 'Darwin':
+            src = Path(BuildConfig.DIST_DIR) / f"{name}.app"
+            shutil.copytree(src, dist_path / f"{name}.app", symlinks=True, copy_function=link_or_copy)
+        else:
+            exe_name = f"{name}{settings['extension']}"
+            src = Path(BuildConfig.DIST_DIR) / exe_name
+            link_or_copy(src, dist_path / exe_name)
+    except FileNotFoundError:
+        pass
+
+    # Copy config file
+    try:
+        shutil.copyfile(BuildConfig.CONFIG_FILE, dist_path / BuildConfig.CONFIG_FILE)
+    except FileNotFoundError:
+        pass
+
+    # Create README
+    (dist_path / "README.txt").write_text(README_TEMPLATE.substitute(platform_name=platform_name))
+    if build_info:
+        (dist_path / "BUILD_INFO.txt").write_text(BUILD_INFO)
 
     print(f"\nDistribution package created: {dist_path}")
 
@@ -348,16 +551,100 @@ Python version: {sys.version}
         archive_format = 'gztar'
 
     print(f"Creating archive: {archive_name}.{archive_format}")
-    shutil.make_archive(
-        str(Path(BuildConfig.DIST_DIR) / archive_name),
-        archive_format,
-        BuildConfig.DIST_DIR,
-        dist_name
-    )
+    create_archive(dist_path, archive_format, compress_level)
 
     return dist_path
 
 
+def walk_entries(root):
+    """Yield every DirEntry below root, each directory before its contents, in name order"""
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            entries = sorted(entries, key=lambda entry: entry.name)
+            for entry in entries:
+                yield entry
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+
+
+def create_archive(dist_path, archive_format, compress_level=1):
+    """Archive dist_path as a top-level folder next to it ('zip' or 'gztar')"""
+    # One scandir walk feeds the archive directly; entries reuse the DirEntry
+    # type info instead of the separate os.walk + stat pass of make_archive.
+    # Entries are sorted and stamped with one fixed time, so unchanged inputs
+    # give a byte-identical archive.
+    base = dist_path.parent
+    epoch = source_date_epoch()
+    if archive_format == 'zip':
+        archive_path = dist_path.with_name(f"{dist_path.name}.zip")
+        date_time = time.gmtime(max(epoch, ZIP_EPOCH))[:6]
+        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=compress_level) as archive:
+            for path in [dist_path, *(entry.path for entry in walk_entries(dist_path))]:
+                info = zipfile.ZipInfo.from_file(path, os.path.relpath(path, base))
+                info.date_time = date_time
+                if info.is_dir():
+                    archive.writestr(info, b'')
+                    continue
+                # Stream the file in rather than loading it whole; open(info, 'w')
+                # takes its compression from info, as ZipFile.write sets it
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info._compresslevel = compress_level
+                with open(path, 'rb') as src, archive.open(info, 'w') as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+    else:
+        archive_path = dist_path.with_name(f"{dist_path.name}.tar.gz")
+        pigz = shutil.which('pigz')
+        if pigz:
+            # Stream an uncompressed tar into pigz, which deflates on every core
+            try:
+                with open(archive_path, 'wb') as output:
+                    # -n leaves the name and timestamp out of the gzip header
+                    cmd = [pigz, f"-{compress_level}", '-n', '-p', str(usable_cpus())]
+                    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=output)
+                    try:
+                        with tarfile.open(fileobj=proc.stdin, mode='w|') as archive:
+                            add_tar_entries(archive, dist_path, epoch)
+                        proc.stdin.close()
+                    except BaseException:
+                        # Don't leave pigz waiting for the rest of its input
+                        proc.kill()
+                        with contextlib.suppress(OSError):
+                            proc.stdin.close()
+                        raise
+                    finally:
+                        proc.wait()
+                if proc.returncode != 0:
+                    raise RuntimeError(f"pigz failed with exit code {proc.returncode}")
+            except BaseException:
+                # A truncated .tar.gz would pass for a finished archive
+                archive_path.unlink(missing_ok=True)
+                raise
+        else:
+            # GzipFile directly, so the header gets no file name and a fixed mtime
+            with open(archive_path, 'wb') as output, \
+                    gzip.GzipFile('', 'wb', compress_level, output, mtime=epoch) as compressed, \
+                    tarfile.open(fileobj=compressed, mode='w') as archive:
+                add_tar_entries(archive, dist_path, epoch)
+
+    return archive_path
+
+
+def add_tar_entries(archive, dist_path, mtime):
+    """Add dist_path and everything below it to an open tar archive, owned by root at mtime"""
+    def normalize(info):
+        info.mtime = mtime
+        info.uid = info.gid = 0
+        info.uname = info.gname = ''
+        return info
+
+    base = dist_path.parent
+    archive.add(dist_path, dist_path.name, recursive=False, filter=normalize)
+    for entry in walk_entries(dist_path):
+        archive.add(entry.path, os.path.relpath(entry.path, base), recursive=False, filter=normalize)
+
+
 def main():
     """Main build process"""
     # Parse command line arguments
@@ -365,7 +652,23 @@ def main():
     parser.add_argument('--icon', type=str,
                         help='Path to custom icon file (.ico for Windows, .icns for macOS, .png for Linux)')
     parser.add_argument('--console', action='store_true', help='Show console window (useful for debugging)')
+    parser.add_argument('--fresh', action='store_true',
+                        help='Discard previous build artifacts and PyInstaller caches before building')
+    parser.add_argument('--compress-level', type=int, default=1, choices=range(10), metavar='0-9',
+                        help='Archive compression level: 1 (default) is fast, 9 is smallest for releases')
+    parser.add_argument('--upx', action='store_true',
+                        help='Compress bundled binaries with UPX (slow; meant for release builds)')
+    parser.add_argument('--upx-dir', type=str,
+                        help='Directory containing the UPX executable to use (implies --upx)')
+    parser.add_argument('--embed-build-info', action='store_true',
+                        help='Add BUILD_INFO.txt with the host platform and Python version to the package')
+    parser.add_argument('--variants', nargs='+', choices=['windowed', 'console'],
+                        help='Build these variants in parallel, each named PyCurveBug-<variant>')
     args = parser.parse_args()
+    upx = args.upx or bool(args.upx_dir)
+
+    # Pin one build timestamp for PyInstaller and the archives
+    os.environ['SOURCE_DATE_EPOCH'] = str(source_date_epoch())
 
     print("=" * 80)
     print(f"Building {BuildConfig.APP_NAME} v{BuildConfig.VERSION}")
@@ -376,41 +679,61 @@ def main():
         print(f"Error: {BuildConfig.MAIN_SCRIPT} not found!")
         return 1
 
-    # Check dependencies
-    print("\nChecking dependencies...")
-    if not check_dependencies():
-        return 1
-    print("\nAll dependencies installed.")
-
-    # Detect platform
-    platform_name = get_platform()
-    print(f"\nBuilding for: {platform_name}")
-
-    # Override console setting if requested
-    if args.console:
-        BuildConfig.PLATFORM_SETTINGS[platform_name]['console'] = True
-        print("Console window enabled for debugging")
-
-    # Find icon
-    print("\nLooking for icon file...")
-    icon_path = find_icon(platform_name, args.icon)
-
-    # Clean previous builds
-    print("\nCleaning previous builds...")
-    clean_build_dirs()
-
-    # Create spec file
+    # Deleting old build trees only waits on the disk, so it runs in the background
+    # while dependencies and the icon are checked; specs are written once it's done
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        cleaning = None
+        if args.fresh:
+            print("\nCleaning previous builds...")
+            cleaning = executor.submit(clean_build_dirs)
+
+        # Check dependencies
+        print("\nChecking dependencies...")
+        if not check_dependencies():
+            return 1
+        print("\nAll dependencies installed.")
+
+        # Detect platform
+        platform_name = get_platform()
+        print(f"\nBuilding for: {platform_name}")
+
+        # Override console setting if requested
+        if args.console:
+            BuildConfig.PLATFORM_SETTINGS[platform_name]['console'] = True
+            print("Console window enabled for debugging")
+
+        # Find icon
+        print("\nLooking for icon file...")
+        icon_path = find_icon(platform_name, args.icon)
+
+        if cleaning:
+            cleaning.result()
+
+    # Create spec files
     print("\nCreating PyInstaller spec file...")
-    spec_file = create_spec_file(platform_name, icon_path)
+    variants = []
+    if args.variants:
+        for variant in dict.fromkeys(args.variants):
+            name = f"{BuildConfig.APP_NAME}-{variant}"
+            variants.append((name, create_spec_file(platform_name, icon_path, name, variant == 'console', upx)))
+    else:
+        variants.append((BuildConfig.APP_NAME, create_spec_file(platform_name, icon_path, upx=upx)))
 
-    # Build executable
-    if not build_executable(spec_file):
+    # Build executables
+    if len(variants) == 1:
+        built = build_executable(variants[0][1], args.fresh, upx_dir=args.upx_dir)
+    else:
+        built = build_variants(variants, args.fresh, args.upx_dir)
+    if not built:
         print("\nBuild failed!")
         return 1
 
-    # Create distribution package
+    # Create distribution packages
     print("\nCreating distribution package...")
-    dist_path = create_distribution_package(platform_name)
+    dist_paths = [create_distribution_package(platform_name, name, args.compress_level,
+                                              args.embed_build_info)
+                  for name, _ in variants]
+    dist_path = ', '.join(str(path) for path in dist_paths)
 
     print("\n" + "=" * 80)
     print("Build completed successfully!")